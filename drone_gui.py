@@ -7,6 +7,7 @@ A comprehensive graphical interface for controlling DJI Tello drones
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
+import concurrent.futures
 import time
 try:
     import cv2
@@ -18,15 +19,25 @@ from PIL import Image, ImageTk
 import numpy as np
 from tello_drone_agent import TelloDroneAgent
 import queue
+import collections
+import ctypes
+import ctypes.util
+import functools
+import importlib.util
+import heapq
+import itertools
+import re
+import shutil
+import subprocess
 import sys
+import tempfile
+import wave
+import webbrowser
 
-# Voice command support
-try:
-    import speech_recognition as sr
-    VOICE_AVAILABLE = True
-except ImportError:
-    sr = None
-    VOICE_AVAILABLE = False
+# Voice command support - only probed here, imported on first use by
+# setup_voice_recognition (see _load_speech_recognition)
+sr = None
+VOICE_AVAILABLE = importlib.util.find_spec('speech_recognition') is not None
 
 # Text-to-speech support
 try:
@@ -36,6 +47,46 @@ except ImportError:
     pyttsx3 = None
     TTS_AVAILABLE = False
 
+# Command-line espeak TTS (espeak-ng preferred) - a PATH lookup, no process spawned
+ESPEAK_COMMAND = next((name for name in ('espeak-ng', 'espeak') if shutil.which(name)), None)
+
+# Platform checks resolved once at import for the audio paths
+IS_WINDOWS = sys.platform.startswith('win')
+# Keeps spawned players/PowerShell from flashing a console window on Windows
+SUBPROCESS_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if IS_WINDOWS else 0
+
+# Command-line audio players for TTS playback, in order of preference, keeping
+# only the installed ones so a missing binary never costs a failed spawn
+if IS_WINDOWS:
+    AUDIO_PLAYER_CANDIDATES = (
+        ('powershell', 'PowerShell Media Player'),
+        ('wmplayer', 'Windows Media Player'),
+        ('ffplay', 'FFPlay'),
+        ('vlc', 'VLC Media Player'),
+        ('mplay32', 'Windows Media Player Classic'),
+    )
+else:
+    AUDIO_PLAYER_CANDIDATES = (
+        ('aplay', 'ALSA Audio Player'),
+        ('paplay', 'PulseAudio Player'),
+        ('play', 'SoX Audio Player'),
+        ('ffplay', 'FFPlay'),
+        ('mpg123', 'MPG123 Player'),
+        ('cvlc', 'VLC Command Line'),
+    )
+AVAILABLE_AUDIO_PLAYERS = tuple(
+    (player, description) for player, description in AUDIO_PLAYER_CANDIDATES if shutil.which(player))
+
+# Players tried by the audio test, per platform
+if sys.platform.startswith('linux'):
+    TEST_AUDIO_PLAYERS = ('aplay', 'paplay', 'play', 'ffplay')
+elif IS_WINDOWS:
+    TEST_AUDIO_PLAYERS = ('powershell', 'ffplay')
+elif sys.platform.startswith('darwin'):
+    TEST_AUDIO_PLAYERS = ('afplay', 'ffplay')
+else:
+    TEST_AUDIO_PLAYERS = ('ffplay', 'play')
+
 # Audio playback support
 try:
     import simpleaudio as sa
@@ -44,6 +95,12 @@ except ImportError:
     sa = None
     SIMPLEAUDIO_AVAILABLE = False
 
+# Win32 sound API, used for TTS playback on Windows
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
 # Real-time audio support (from advanced agent)
 try:
     import pyaudio
@@ -56,15 +113,19 @@ except ImportError:
     asyncio = None
     REALTIME_AUDIO_AVAILABLE = False
 
-# Removed gTTS support - using simple TTS only
-
-# Azure OpenAI support
+# Faster event loop for the realtime session thread (POSIX only, optional)
 try:
-    from openai import AzureOpenAI
-    AZURE_OPENAI_AVAILABLE = True
+    import uvloop
 except ImportError:
-    AzureOpenAI = None
-    AZURE_OPENAI_AVAILABLE = False
+    uvloop = None
+
+# Removed gTTS support - using simple TTS only
+
+# Azure OpenAI support - only probed here, imported on first use by
+# _get_azure_client (see _load_azure_openai)
+AzureOpenAI = None
+AZURE_OPENAI_AVAILABLE = importlib.util.find_spec('openai') is not None
+if not AZURE_OPENAI_AVAILABLE:
     print("⚠️ Azure OpenAI unavailable: openai package not installed")
 
 # JSON is part of standard library
@@ -78,6 +139,472 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# ===== LAZY OPTIONAL IMPORTS =====
+def _load_speech_recognition():
+    """Import speech_recognition on first use and publish it as module-level ``sr``."""
+    global sr
+    if sr is None:
+        import speech_recognition
+        sr = speech_recognition
+    return sr
+
+
+def _load_azure_openai():
+    """Import the AzureOpenAI client class on first use."""
+    global AzureOpenAI
+    if AzureOpenAI is None:
+        from openai import AzureOpenAI as azure_openai_cls
+        AzureOpenAI = azure_openai_cls
+    return AzureOpenAI
+
+
+# ===== DIRECT COMMAND CLASSIFICATION =====
+# Commands without parameters
+BASIC_COMMANDS = frozenset(['takeoff', 'land', 'flip', 'photo', 'picture', 'burst'])
+
+# Prefixes for "<prefix> <number>" commands, e.g. "forward 100", "cw 90"
+NUMERIC_COMMAND_PREFIXES = ('forward ', 'back ', 'left ', 'right ', 'up ', 'down ', 'cw ', 'ccw ')
+
+# Variadic commands that still need a regex
+DIRECT_COMMAND_PATTERNS = (
+    re.compile(r'^go\s+[-]?\d+\s+[-]?\d+\s+[-]?\d+\s+\d+$'),      # go x y z speed
+    re.compile(r'^curve\s+([-]?\d+\s+){6}\d+$'),                  # curve x1 y1 z1 x2 y2 z2 speed
+    re.compile(r'^(photo|picture)\s+\S+$'),                        # photo filename.jpg
+    re.compile(r'^burst(\s+\d+(\s+\d*\.?\d+(\s+\S+)?)?)?$'),         # burst [count] [interval] [prefix]
+)
+
+# Voice movement/rotation phrases ("fly forward", "turn left"...) in one
+# pattern; the matched group name says which action to run
+VOICE_MOTION_PATTERN = re.compile(
+    r'(?:move|fly|go) (?P<move>forward|back|left|right|up|down)'
+    r'|(?:turn|rotate|spin) (?P<rotate>left|right)'
+)
+
+# Precise movement functions exposed to the realtime assistant -> Tello command
+PRECISE_COMMANDS = {
+    'precise_move_forward': 'forward',              # 5-300cm
+    'precise_move_backward': 'back',                # 5-100cm
+    'precise_move_left': 'left',                    # 5-100cm
+    'precise_move_right': 'right',                  # 5-100cm
+    'precise_move_up': 'up',                        # 20-100cm
+    'precise_move_down': 'down',                    # 20-100cm
+    'precise_rotate_clockwise': 'cw',               # 30-180°
+    'precise_rotate_counter_clockwise': 'ccw',      # 30-180°
+}
+
+# Tello commands fly_path accepts, with the (min, max) value each takes;
+# None marks commands sent without a value
+FLY_PATH_RANGES = {
+    'takeoff': None,
+    'land': None,
+    'forward': (5, 300),
+    'back': (5, 100),
+    'left': (5, 100),
+    'right': (5, 100),
+    'up': (20, 100),
+    'down': (20, 100),
+    'cw': (30, 180),
+    'ccw': (30, 180),
+}
+
+# AI mission actions -> sequential processor command strings, used by
+# _ai_command_to_string; parameters default as the planner documents
+AI_ACTION_FORMATTERS = {
+    'takeoff': lambda params: 'takeoff',
+    'land': lambda params: 'land',
+    'move_forward': lambda params: f"forward {params.get('distance', 50)}",
+    'move_back': lambda params: f"back {params.get('distance', 50)}",
+    'move_left': lambda params: f"left {params.get('distance', 50)}",
+    'move_right': lambda params: f"right {params.get('distance', 50)}",
+    'move_up': lambda params: f"up {params.get('distance', 50)}",
+    'move_down': lambda params: f"down {params.get('distance', 50)}",
+    'rotate_clockwise': lambda params: f"cw {params.get('degrees', 90)}",
+    'rotate_counter_clockwise': lambda params: f"ccw {params.get('degrees', 90)}",
+    'hover': lambda params: f"hover {params.get('seconds', 3)}",
+    'take_photo': lambda params: 'photo',
+    'take_photo_burst': lambda params: f"burst {params.get('count', 3)}",
+    'analyze_view': lambda params: "analyze_view " + json.dumps({
+        "prompt": params.get('prompt', 'Describe what you see'),
+        "use_photo": params.get('use_photo', False),
+    }),
+}
+
+# Function-call style actions ('move_forward(300)') and the parameter their
+# single numeric argument fills
+AI_FUNCTION_CALL_PATTERN = re.compile(r'(\w+)\(([^)]*)\)')
+AI_FUNCTION_CALL_PARAMS = {
+    'move_forward': 'distance',
+    'move_back': 'distance',
+    'move_left': 'distance',
+    'move_right': 'distance',
+    'move_up': 'distance',
+    'move_down': 'distance',
+    'rotate_clockwise': 'degrees',
+    'rotate_counter_clockwise': 'degrees',
+    'hover': 'seconds',
+}
+
+# Curve waypoints must be at least this far from the current position
+CURVE_MIN_WAYPOINT_CM = 20
+
+# Local commands handled by the GUI without the drone agent
+LOCAL_COMMANDS = {
+    'test audio': 'test_audio',
+    'audio test': 'test_audio',
+    'audio diagnostics': 'audio_diagnostics',
+    'full audio test': 'audio_diagnostics',
+    'test tts': 'test_tts',
+    'tts test': 'test_tts',
+}
+
+
+# ===== AZURE OPENAI PROMPTS =====
+# Sent verbatim as the first message of every request so the service's automatic
+# prompt caching can reuse the prefix - never interpolate per-call values here
+# System prompt for translating natural language into drone commands
+AZURE_COMMAND_SYSTEM_PROMPT = """You are an intelligent drone command interpreter. Convert natural language instructions into specific drone commands.
+
+Available drone commands:
+- takeoff: Make the drone take off
+- land: Make the drone land
+- move_forward(distance): Move forward in cm (20-500)
+- move_back(distance): Move backward in cm (20-500)  
+- move_left(distance): Move left in cm (20-500)
+- move_right(distance): Move right in cm (20-500)
+- move_up(distance): Move up in cm (20-500)
+- move_down(distance): Move down in cm (20-500)
+- rotate_clockwise(degrees): Rotate clockwise (1-360)
+- rotate_counter_clockwise(degrees): Rotate counter-clockwise (1-360)
+- hover(seconds): Hover in place for specified seconds
+- take_photo(): Take a single photo
+- take_photo_burst(count): Take multiple photos
+- analyze_view(prompt, use_photo): Analyze current view or saved photo with custom prompt
+- start_video_recording(): Start recording video
+- stop_video_recording(): Stop recording video
+- enable_detection(type): Enable object detection (face, person, vehicle)
+- disable_detection(): Disable object detection
+- start_follow_mode(type): Start following detected objects
+- stop_follow_mode(): Stop following objects
+
+CRITICAL: You MUST respond with a JSON object containing a "commands" array. Even for single commands, wrap them in an array.
+
+Required format: {"commands": [{"action": "command_name", "parameters": {...}}]}
+
+IMPORTANT: For analyze_view commands, generate SPECIFIC prompts based on user intent:
+- If user says "describe" → prompt focuses on scene/atmosphere description
+- If user says "identify objects" → prompt focuses on object identification and listing
+- If user says "identify [specific thing]" → prompt focuses on that specific thing
+- If user mentions "picture" or "photo" → set use_photo: true
+- If user says "now", "current view", "currently" → set use_photo: false
+
+Examples:
+- "land safely" → {"commands": [{"action": "land", "parameters": {}}]}
+- "fly forward 2 meters" → {"commands": [{"action": "move_forward", "parameters": {"distance": 200}}]}
+- "turn left 90 degrees then move right" → {"commands": [{"action": "rotate_counter_clockwise", "parameters": {"degrees": 90}}, {"action": "move_right", "parameters": {"distance": 100}}]}
+- "take off and hover for 5 seconds" → {"commands": [{"action": "takeoff", "parameters": {}}, {"action": "hover", "parameters": {"seconds": 5}}]}
+- "take a photo and describe it" → {"commands": [{"action": "take_photo", "parameters": {}}, {"action": "analyze_view", "parameters": {"prompt": "describe the overall scene, colors, and atmosphere in this photo", "use_photo": true}}]}
+- "take a picture and identify objects" → {"commands": [{"action": "take_photo", "parameters": {}}, {"action": "analyze_view", "parameters": {"prompt": "identify and list all objects visible in this photo", "use_photo": true}}]}
+- "take picture and identify objects in the picture" → {"commands": [{"action": "take_photo", "parameters": {}}, {"action": "analyze_view", "parameters": {"prompt": "identify and list all objects visible in this photo", "use_photo": true}}]}
+- "take photo then identify cars" → {"commands": [{"action": "take_photo", "parameters": {}}, {"action": "analyze_view", "parameters": {"prompt": "count and describe all cars visible in this photo", "use_photo": true}}]}
+- "take photo and look for people" → {"commands": [{"action": "take_photo", "parameters": {}}, {"action": "analyze_view", "parameters": {"prompt": "identify and count people in this photo", "use_photo": true}}]}
+- "describe what you see now" → {"commands": [{"action": "analyze_view", "parameters": {"prompt": "describe the current live view from the drone camera", "use_photo": false}}]}
+- "what objects are visible right now" → {"commands": [{"action": "analyze_view", "parameters": {"prompt": "identify objects currently visible in the live camera feed", "use_photo": false}}]}
+- "count buildings in current view" → {"commands": [{"action": "analyze_view", "parameters": {"prompt": "count and describe buildings visible in the current view", "use_photo": false}}]}"""
+
+# System prompt for camera image analysis
+AZURE_VISION_SYSTEM_PROMPT = "You are a drone vision assistant. Analyze images from a drone's perspective and provide clear, concise descriptions. Always limit your response to 2-3 sentences maximum."
+
+# System prompt for the mission planner preview
+AZURE_MISSION_SYSTEM_PROMPT = """You are an expert drone mission planner. Convert natural language mission descriptions into safe, executable drone command sequences.
+
+Available commands:
+- takeoff: Make drone take off
+- land: Make drone land safely  
+- move_forward(distance): Move forward 20-500cm
+- move_back(distance): Move backward 20-500cm
+- move_left(distance): Move left 20-500cm
+- move_right(distance): Move right 20-500cm
+- move_up(distance): Move up 20-500cm
+- move_down(distance): Move down 20-500cm
+- rotate_clockwise(degrees): Rotate right 1-360°
+- rotate_counter_clockwise(degrees): Rotate left 1-360°
+- hover(seconds): Hover for 1-8 seconds
+- take_photo(): Take single photo
+- take_photo_burst(count): Take multiple photos
+
+SAFETY RULES:
+- Always start with takeoff if not already flying
+- Always end missions with land command
+- Keep distances reasonable (under 300cm for safety)
+- Include hover commands for stability between moves
+- Add safety margins and hover time before photos
+
+Respond with a JSON object: {"commands": [...], "safety_notes": "...", "estimated_time": "X minutes"}
+
+Example response:
+{"commands": [{"action": "takeoff", "parameters": {}}, {"action": "hover", "parameters": {"seconds": 3}}, {"action": "take_photo", "parameters": {}}, {"action": "land", "parameters": {}}], "safety_notes": "Mission includes proper takeoff/landing sequence with stability pauses", "estimated_time": "2 minutes"}"""
+
+# Panorama analysis - each photo is captioned while the drone is still turning,
+# then one text-only request combines the captions
+PANORAMA_TILE_PROMPT = "In one sentence, list the main objects and landmarks in this drone photo."
+PANORAMA_SUMMARY_PROMPT = "These are descriptions of {count} photos taken while a drone turned a full circle, each labelled with the heading it was taken at. Describe the overall 360-degree scene, key landmarks, objects, and any interesting features."
+
+_AI_INPUT_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def _normalize_ai_input(text):
+    """Cache key for an AI command request - lowercase, no punctuation, single spaces."""
+    return ' '.join(_AI_INPUT_PUNCTUATION.sub(' ', text.lower()).split())
+
+
+# Single-verb requests, plus the common "take a photo and describe it" pair,
+# resolved locally before falling back to Azure OpenAI; anything else still
+# goes to the model. The find target stops at "and"/"then" so multi-step
+# requests ("...find the red car then land") fail the match instead of
+# losing their later steps
+LOCAL_AI_COMMAND_PATTERN = re.compile(
+    r'(?:please )?(?:'
+    r'(?P<takeoff>take ?off|launch)'
+    r'|(?P<land>land(?: now| safely)?)'
+    r'|(?:move|fly|go) (?P<move>forward|back|backward|left|right|up|down)'
+    r'(?: (?P<distance>\d+(?:\.\d+)?) ?(?P<unit>cm|centimeters?|m|meters?|metres?))?'
+    r'|(?:turn|rotate) (?P<rotate>left|right)(?: (?P<degrees>\d+) ?degrees?)?'
+    r'|hover(?: for)? (?P<seconds>\d+) ?seconds?'
+    r'|(?P<photo>take (?:a )?(?:photo|picture))'
+    r'|take (?:a )?(?:photo|picture)(?: and| then| &)+ (?:'
+    r'(?P<describe>(?:describe|analy[sz]e)(?: it| the (?:photo|picture))?)'
+    r'|(?P<objects>identify (?:the )?objects(?: in (?:it|the (?:photo|picture)))?)'
+    r'|(?P<find>identify|count|look for|find) (?P<target>[a-z]+(?: (?!(?:and|then)\b)[a-z]+)*)'
+    r')'
+    r')'
+)
+
+# Values the local matcher accepts as-is; anything outside goes to the model
+# rather than being clamped into range
+LOCAL_MOVE_RANGE_CM = (20, 500)
+LOCAL_ROTATE_RANGE_DEG = (1, 360)
+
+# analyze_view prompts for the local photo-and-analyze pair, worded like the
+# examples in AZURE_COMMAND_SYSTEM_PROMPT
+LOCAL_PHOTO_ANALYSIS_PROMPTS = {
+    'describe': "describe the overall scene, colors, and atmosphere in this photo",
+    'objects': "identify and list all objects visible in this photo",
+    'identify': "identify and describe all {target} visible in this photo",
+    'count': "count and describe all {target} visible in this photo",
+    'look for': "identify and count {target} in this photo",
+    'find': "identify and count {target} in this photo",
+}
+
+
+def _match_local_ai_command(text):
+    """Return an AI-format command list for a simple request, or None for the model."""
+    match = LOCAL_AI_COMMAND_PATTERN.fullmatch(' '.join(text.lower().strip(' .!?').split()))
+    if not match:
+        return None
+    
+    if match.group('takeoff'):
+        return [{"action": "takeoff", "parameters": {}}]
+    if match.group('land'):
+        return [{"action": "land", "parameters": {}}]
+    if match.group('photo'):
+        return [{"action": "take_photo", "parameters": {}}]
+    if match.group('describe') or match.group('objects') or match.group('find'):
+        if match.group('find'):
+            prompt = LOCAL_PHOTO_ANALYSIS_PROMPTS[match.group('find')].format(target=match.group('target'))
+        else:
+            prompt = LOCAL_PHOTO_ANALYSIS_PROMPTS['describe' if match.group('describe') else 'objects']
+        return [
+            {"action": "take_photo", "parameters": {}},
+            {"action": "analyze_view", "parameters": {"prompt": prompt, "use_photo": True}},
+        ]
+    if match.group('seconds'):
+        return [{"action": "hover", "parameters": {"seconds": int(match.group('seconds'))}}]
+    if match.group('rotate'):
+        action = 'rotate_clockwise' if match.group('rotate') == 'right' else 'rotate_counter_clockwise'
+        degrees = int(match.group('degrees') or 90)
+        if not LOCAL_ROTATE_RANGE_DEG[0] <= degrees <= LOCAL_ROTATE_RANGE_DEG[1]:
+            return None
+        return [{"action": action, "parameters": {"degrees": degrees}}]
+    
+    direction = 'back' if match.group('move') == 'backward' else match.group('move')
+    distance = 50
+    if match.group('distance'):
+        distance = float(match.group('distance'))
+        if match.group('unit').startswith('m'):
+            distance *= 100
+        distance = int(distance)
+        if not LOCAL_MOVE_RANGE_CM[0] <= distance <= LOCAL_MOVE_RANGE_CM[1]:
+            return None
+    return [{"action": f"move_{direction}", "parameters": {"distance": distance}}]
+
+
+# ===== FRAME HASHING =====
+def _frame_dhash(frame):
+    """64-bit difference hash of a BGR numpy frame or PIL image.
+    
+    The frame is reduced to 9x8 grayscale and each bit records whether a pixel is
+    brighter than its right-hand neighbour, so small noise barely moves the hash.
+    """
+    if isinstance(frame, np.ndarray):
+        gray = frame
+        if frame.ndim == 3:
+            gray = cv2.cvtColor(frame[:, :, :3], cv2.COLOR_BGR2GRAY) if CV2_AVAILABLE else frame[:, :, :3].mean(axis=2)
+        small = (cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA) if CV2_AVAILABLE
+                 else np.asarray(Image.fromarray(gray.astype(np.uint8)).resize((9, 8), Image.BILINEAR)))
+    else:
+        small = np.asarray(frame.convert('L').resize((9, 8), Image.BILINEAR))
+    return int.from_bytes(np.packbits(small[:, 1:] > small[:, :-1]).tobytes(), 'big')
+
+
+# ===== AUDIO FALLBACK TONE =====
+# Beep written when no speech engine can produce a WAV file
+BEEP_SAMPLE_RATE = 44100
+BEEP_DURATION = 2.0
+BEEP_FREQUENCY = 800
+
+
+@functools.lru_cache(maxsize=1)
+def _beep_wav_bytes():
+    """Complete mono 16-bit WAV file for the fallback beep, synthesized once."""
+    t = np.arange(int(BEEP_DURATION * BEEP_SAMPLE_RATE), dtype=np.float64)
+    samples = (32767 * np.sin(2 * np.pi * BEEP_FREQUENCY * t / BEEP_SAMPLE_RATE)).astype('<i2')
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)  # Mono
+        wav_file.setsampwidth(2)  # 2 bytes per sample
+        wav_file.setframerate(BEEP_SAMPLE_RATE)
+        wav_file.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def _write_beep_wav(path):
+    """Write the fallback beep to ``path`` - shared by TTS playback and the audio test."""
+    with open(path, 'wb') as wav_file:
+        wav_file.write(_beep_wav_bytes())
+
+
+# ===== DELAYED FILE CLEANUP =====
+# Played TTS files are removed by one long-lived worker instead of a
+# sleeping thread per utterance. The worker starts on first use and is
+# stopped by _stop_cleanup_worker when the GUI shuts down
+_cleanup_queue = queue.Queue()
+_cleanup_thread = None
+_cleanup_lock = threading.Lock()
+
+
+def _cleanup_worker():
+    """Remove queued (ready_at, path) files once their deadline passes, until a None sentinel."""
+    pending = []
+    while True:
+        timeout = max(0.0, pending[0][0] - time.monotonic()) if pending else None
+        try:
+            item = _cleanup_queue.get(timeout=timeout)
+            if item is None:
+                break
+            heapq.heappush(pending, item)
+        except queue.Empty:
+            pass
+        now = time.monotonic()
+        while pending and pending[0][0] <= now:
+            _, path = heapq.heappop(pending)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    # Shutting down - nothing is playing any more, remove what's left now
+    for _, path in pending:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _remove_file_later(path, delay):
+    """Schedule ``path`` for removal after ``delay`` seconds."""
+    global _cleanup_thread
+    with _cleanup_lock:
+        if _cleanup_thread is None:
+            _cleanup_thread = threading.Thread(target=_cleanup_worker, name='file-cleanup', daemon=True)
+            _cleanup_thread.start()
+        _cleanup_queue.put((time.monotonic() + delay, path))
+
+
+def _stop_cleanup_worker(timeout=None):
+    """Stop the cleanup worker if it was started, removing files still waiting."""
+    global _cleanup_thread
+    with _cleanup_lock:
+        thread, _cleanup_thread = _cleanup_thread, None
+        if thread is not None:
+            _cleanup_queue.put(None)
+    if thread is not None:
+        thread.join(timeout=timeout)
+
+
+# ===== IN-PROCESS ESPEAK =====
+# libespeak-ng is loaded once so each utterance doesn't fork an espeak process;
+# callers fall back to the espeak command line when the library isn't found
+_ESPEAK_AUDIO_OUTPUT_SYNCHRONOUS = 2
+_ESPEAK_POS_CHARACTER = 1
+_ESPEAK_CHARS_UTF8 = 1
+_ESPEAK_SYNTH_CALLBACK = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.POINTER(ctypes.c_short), ctypes.c_int, ctypes.c_void_p)
+
+_espeak = None  # (library, sample_rate) once loaded, False if unavailable
+_espeak_lock = threading.Lock()  # The library is not re-entrant
+_espeak_pcm = bytearray()  # Filled by the synth callback for the current utterance
+
+
+@_ESPEAK_SYNTH_CALLBACK
+def _espeak_collect_samples(wav, num_samples, events):
+    """libespeak-ng synth callback - append the chunk's 16-bit samples."""
+    if num_samples > 0 and wav:
+        _espeak_pcm.extend(ctypes.string_at(wav, num_samples * 2))
+    return 0  # Keep synthesizing
+
+
+def _load_espeak():
+    """Load and initialize libespeak-ng on first use; returns (library, sample_rate) or None."""
+    global _espeak
+    if _espeak is None:
+        _espeak = False
+        path = ctypes.util.find_library('espeak-ng')
+        if path:
+            try:
+                lib = ctypes.CDLL(path)
+                lib.espeak_Synth.argtypes = [
+                    ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint, ctypes.c_int,
+                    ctypes.c_uint, ctypes.c_uint, ctypes.POINTER(ctypes.c_uint), ctypes.c_void_p]
+                sample_rate = lib.espeak_Initialize(_ESPEAK_AUDIO_OUTPUT_SYNCHRONOUS, 0, None, 0)
+                if sample_rate > 0:
+                    lib.espeak_SetSynthCallback(_espeak_collect_samples)
+                    _espeak = (lib, sample_rate)
+            except (OSError, AttributeError):
+                pass
+    return _espeak or None
+
+
+def _espeak_synth_to_wav(text, audio_file):
+    """Synthesize text into a WAV file in-process; False if libespeak-ng is unavailable or fails."""
+    with _espeak_lock:
+        espeak = _load_espeak()
+        if espeak is None:
+            return False
+        lib, sample_rate = espeak
+        
+        data = text.encode('utf-8')
+        _espeak_pcm.clear()
+        if lib.espeak_Synth(data, len(data) + 1, 0, _ESPEAK_POS_CHARACTER, 0,
+                            _ESPEAK_CHARS_UTF8, None, None) != 0 or not _espeak_pcm:
+            return False
+        
+        with wave.open(audio_file, 'wb') as wav_file:
+            wav_file.setnchannels(1)  # Mono
+            wav_file.setsampwidth(2)  # 2 bytes per sample
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(_espeak_pcm)
+        return True
+
 
 # ===== ENHANCED LOGGING SYSTEM =====
 class LogLevel(Enum):
@@ -367,8 +894,9 @@ class DroneTheme:
     }
     
     @classmethod
+    @functools.lru_cache(maxsize=64)
     def get_font(cls, size='base', weight='normal', family=None):
-        """Get font tuple for tkinter widgets"""
+        """Get font tuple for tkinter widgets (memoized - fonts are fixed per theme)"""
         font_family = family or cls.FONTS['family']
         font_size = cls.FONTS[f'size_{size}']
         font_weight = cls.FONTS[f'weight_{weight}']
@@ -402,6 +930,98 @@ class DroneTheme:
         )
 
 
+# Settings dialog field options, shared by every label/entry pair. Plain tk
+# widgets so the dark colours hold under every platform theme
+SETTINGS_LABEL_OPTIONS = {'font': ('Arial', 11, 'bold'), 'fg': 'white', 'bg': '#2b2b2b'}
+SETTINGS_ENTRY_OPTIONS = {
+    'font': ('Arial', 10),
+    'bg': '#404040',
+    'fg': 'white',
+    'insertbackground': 'white',
+    'width': 60,
+}
+
+# Activity log size limits - once the log exceeds LOG_MAX_LINES the oldest
+# lines are dropped in chunks so Text widget layout cost stays bounded
+LOG_MAX_LINES = 1000
+LOG_PRUNE_LINES = 200
+
+# Status polling - the status tick keeps its original 2s cadence; battery
+# needs a round-trip to the drone so it runs on its own slower schedule
+STATUS_POLL_MS = 2000
+BATTERY_POLL_MS = 10000
+
+# process_messages poll interval - fast while video frames need presenting,
+# slower otherwise since only log lines arrive
+VIDEO_POLL_MS = 50
+MESSAGE_POLL_MS = 100
+
+# Resolution of the shared UI timer that expires toasts and the photo flash
+UI_TIMER_TICK_MS = 50
+
+# Voice recognition - speech-to-text requests run on a small pool so the
+# microphone can keep listening; failed requests back off exponentially
+VOICE_RECOGNITION_WORKERS = 2
+VOICE_MAX_BACKOFF = 30.0
+VOICE_PENDING_AUDIO = 3  # Clips waiting for recognition; the oldest is dropped beyond this
+
+# Text-to-speech - utterances waiting to be spoken (oldest dropped beyond this)
+# and the window in which an identical repeat is skipped. A streamed answer is
+# one utterance however many sentences it has
+TTS_QUEUE_SIZE = 4
+TTS_REPEAT_WINDOW = 2.0
+TTS_STREAM_TIMEOUT = 30.0  # Seconds to wait for a streamed utterance's next sentence
+
+# Interpreted AI command lists remembered per (deployment, normalized input)
+AI_COMMAND_CACHE_SIZE = 512
+
+# Worker pool size for short-lived drone actions (takeoff, moves, photos...)
+COMMAND_POOL_WORKERS = 4
+
+# Vision requests - frames are downscaled and re-encoded before upload; the
+# high-detail image mode is only requested when the prompt asks for fine detail
+VISION_ANALYSIS_WORKERS = 2  # Concurrent vision requests - more just trips rate limits
+VISION_MAX_SIDE = 768
+VISION_JPEG_QUALITY = 70
+# Whole words only, so "already" or "countryside" stay at low detail
+VISION_HIGH_DETAIL_PATTERN = re.compile(r'\b(?:small|tiny|identify|read|text|detail|count)\b')
+VISION_MAX_TOKENS = 100  # The system prompt asks for 2-3 sentences
+VISION_REQUEST_TIMEOUT = 30.0  # Seconds before a vision request is abandoned
+VISION_SENTENCE_END = re.compile(r'[.!?]\s')  # Where streamed results are handed to TTS
+
+# Panorama stitching - frames go to cv2.Stitcher at full size; it detects
+# features at REGISTRATION and blends at COMPOSITING resolution (megapixels),
+# so no separate resize pass is needed
+PANORAMA_REGISTRATION_RESOL = 0.3
+PANORAMA_COMPOSITING_RESOL = 0.5  # About the 800px-wide frames previously stitched
+# Fallback attempts: (name, stitcher mode, confidence, panorama confidence)
+PANORAMA_STITCH_ATTEMPTS = (
+    ("Standard Panorama", "PANORAMA", 1.0, 0.3),
+    ("Relaxed Panorama", "PANORAMA", 0.3, 0.09),
+    ("Scan Mode", "SCANS", 0.3, 0.09),
+    ("Lenient Panorama", "PANORAMA", 0.1, 0.03),
+)
+
+# Mission planner - the plan streams into the preview as it is generated,
+# with text handed to the Tk thread at most this often (seconds)
+MISSION_PREVIEW_FLUSH_INTERVAL = 0.1
+MISSION_PLAN_TIMEOUT = 60.0  # Seconds before a planning request is abandoned
+
+# Continuous vision reuses a recent description when the frame's 64-bit
+# difference hash is within a few bits of one already analyzed
+VISION_HASH_CACHE_SIZE = 32
+VISION_HASH_MAX_DISTANCE = 5  # Differing bits still treated as the same scene
+VISION_HASH_MAX_AGE = 60.0  # Seconds a cached description stays usable
+
+# Daily-log level by leading status emoji; messages without one fall back
+# to a keyword check. '⚠' is matched without its U+FE0F variation selector
+LOG_LEVEL_BY_PREFIX = {
+    '❌': 'failure',
+    '⚠': 'warning',
+    '✅': 'success',
+}
+
+
 class DroneControlGUI:
     def __init__(self, simulation_mode=True):
         """
@@ -431,6 +1051,7 @@ class DroneControlGUI:
             
             # Set up vision analysis callback for agent commands
             self.agent.vision_analysis_callback = self.thread_safe_vision_analysis
+            self._bind_agent_methods()
             
             # Mark simulation mode for auto-connection after full initialization
             self.pending_auto_connect = simulation_mode
@@ -450,11 +1071,35 @@ class DroneControlGUI:
         
         # Video stream variables
         self.video_frame = None
+        self._last_pil_frame = None  # PIL source of the displayed frame, for vision analysis
         self.video_running = False
         self.video_thread = None
         
-        # Message queue for thread-safe GUI updates
-        self.message_queue = queue.Queue()
+        # Cross-thread GUI traffic is split by domain so producers never share
+        # a lock: activity log lines go through gui_log_queue, the video feed
+        # through latest_frame, and rare connection/flight events are
+        # scheduled directly with root.after_idle
+        self.gui_log_queue = queue.SimpleQueue()
+        
+        # Latest video frame only - the 30 FPS producer keeps a single slot
+        # and stale frames are dropped instead of piling up
+        self.latest_frame = collections.deque(maxlen=1)
+        
+        # Shared worker pool for button actions instead of a thread per click
+        self._cmd_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=COMMAND_POOL_WORKERS, thread_name_prefix='drone_cmd')
+        
+        # Vision requests are slow network calls; bursts queue here instead of
+        # each spawning a thread and hitting the API at once
+        self._vision_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=VISION_ANALYSIS_WORKERS, thread_name_prefix='vision')
+        
+        # Flight commands (takeoff, land, moves, mode switch...) must not race
+        # each other inside the agent, so they run one at a time on a single
+        # consumer thread; the pool above is for independent actions like photos
+        self._cmd_q = queue.SimpleQueue()
+        self._cmd_thread = threading.Thread(target=self._command_worker, daemon=True)
+        self._cmd_thread.start()
         
         # Enhanced daily logging system
         self.daily_logger = DailyLogger()
@@ -465,28 +1110,47 @@ class DroneControlGUI:
             "timestamp": datetime.now().isoformat()
         })
         
+        # Daily-log records are categorized and written by a background
+        # thread so log() callers only pay for a queue put
+        self._log_q = queue.SimpleQueue()
+        self._log_thread = threading.Thread(target=self._daily_log_worker, daemon=True)
+        self._log_thread.start()
+        self._ts_cache = (0, '')  # (epoch second, "HH:MM:SS") for log timestamps
+        
         # Voice command variables
         self.voice_enabled = False
         self.voice_running = False
+        self._voice_stop = threading.Event()
+        self._recog_pool = None  # Per-session recognition pool, shut down by the voice loop on exit
+        self.noise_adjusted = False
+        # Plain bool mirror of the "Listen offline" checkbox so the voice
+        # thread never touches Tk; when off, speech heard while disconnected
+        # is dropped before the recognition request
+        self.voice_when_disconnected = True
         self.voice_thread = None
         
         # Vision analysis variables
         self.continuous_vision_enabled = False
-        self.continuous_vision_running = False
+        self._vision_stop_event = threading.Event()  # Set to stop continuous_vision_loop, even mid-wait
         self.continuous_vision_thread = None
         self.vision_analysis_interval = 2.0  # Analyze every 2 seconds
+        self.vision_debug = False  # Log frame types/shapes and prompt choice for each analysis
         
         # Text-to-speech variables
         self.tts_enabled = True  # Enable by default
         self.tts_engine = None
-        self.tts_queue = queue.Queue()
+        self._audio_system_available = None  # Cached by _check_local_audio_system
+        self.tts_queue = queue.Queue(maxsize=TTS_QUEUE_SIZE)
         self.tts_worker_thread = None
         if TTS_AVAILABLE:
             self.setup_tts()
         if VOICE_AVAILABLE:
-            self.recognizer = sr.Recognizer()
+            self.recognizer = None  # Created with the microphone in setup_voice_recognition
             self.microphone = None
             self.voice_command_queue = queue.Queue()
+            # Recognition workers post <<VoiceCommand>> after queueing a command,
+            # so the queue is drained on demand instead of on every poll
+            self.root.bind('<<VoiceCommand>>', lambda event: self._drain_voice_queue())
         else:
             self.recognizer = None
             self.microphone = None
@@ -494,6 +1158,12 @@ class DroneControlGUI:
             
         # Azure OpenAI configuration
         self.azure_openai_client = None
+        self.ai_indicator = None  # Optional AI status label, set by layouts that show one
+        self.settings_window = None
+        self._azure_client_cache = {}  # (endpoint, api_key, api_version) -> client
+        self._azure_client_lock = threading.Lock()
+        self._ai_command_cache = collections.OrderedDict()  # (deployment, text) -> commands JSON
+        self._ai_command_cache_lock = threading.Lock()
         self.ai_enabled = False
         self.azure_settings = {
             'endpoint': '',
@@ -506,14 +1176,39 @@ class DroneControlGUI:
         self.create_widgets()
         self.setup_layout()
         
+        # Control-state cache: buttons are resolved once here and the last
+        # (connected, flying) state is remembered so unchanged ticks are free
+        self._last_ctrl_state = None
+        self._ctrl_dirty = False
+        self._connection_dependent_buttons = (self.execute_btn, self.vision_analyze_btn, self.continuous_vision_btn)
+        self._voice_btn = getattr(self, 'voice_btn', None)
+        self._build_voice_actions()
+        
+        # Coalesced UI work: mutations queued during one event-loop turn are
+        # flushed together from a single after_idle, and delayed UI actions
+        # (toast expiry, flash) share one deadline heap instead of an after()
+        # timer each
+        self._pending_ui_ops = []
+        self._ui_flush_scheduled = False
+        self._ui_timers = []  # heap of (deadline, seq, fn)
+        self._ui_timer_seq = itertools.count()
+        self._ui_timer_running = False
+        
+        # Toast overlay container - created once, placed only while toasts are showing
+        self.toast_container = tk.Frame(self.root, bg=DroneTheme.COLORS['bg_root'])
+        self._toast_visible = False
+        
         # Defer blocking initialization to avoid GUI startup hang
         self.root.after(100, self.deferred_setup)
         
         # Start message processing
         self.process_messages()
         
-        # Status update timer
+        # Status update timers
+        self._battery_cache = (0.0, None)  # (timestamp, value)
+        self._last_flying_status = None
         self.update_status()
+        self.update_battery()
     
     def create_widgets(self):
         """Create all GUI widgets."""
@@ -701,6 +1396,20 @@ class DroneControlGUI:
         )
         self.video_canvas.pack(expand=True, padx=15, pady=15)
         
+        # Single Tk image reused for every video frame - frames are pasted into
+        # it on the GUI thread instead of allocating a new PhotoImage each time
+        self._video_photo = ImageTk.PhotoImage(Image.new('RGB', (480, 360), DroneTheme.COLORS['bg_root']))
+        self._video_item = self.video_canvas.create_image(240, 180, image=self._video_photo)
+        
+        # Camera flash overlay, created once and toggled between hidden/normal
+        self._flash_item = self.video_canvas.create_rectangle(
+            0, 0, 480, 360,
+            fill='white',
+            outline='',
+            stipple='gray50',
+            state='hidden'
+        )
+        
         # Vision Analysis Results Panel
         vision_frame = tk.LabelFrame(
             parent,
@@ -872,6 +1581,21 @@ class DroneControlGUI:
                 bg=DroneTheme.COLORS['bg_surface']
             )
             self.voice_status_label.pack(side='left', padx=8)
+            
+            # Whether to send speech for recognition while no drone is connected
+            self.voice_offline_var = tk.BooleanVar(value=self.voice_when_disconnected)
+            tk.Checkbutton(
+                top_row,
+                text="Listen offline",
+                variable=self.voice_offline_var,
+                command=self._on_voice_offline_toggle,
+                font=('Segoe UI', 9),
+                fg=DroneTheme.COLORS['text_muted'],
+                bg=DroneTheme.COLORS['bg_surface'],
+                selectcolor=DroneTheme.COLORS['bg_input'],
+                activebackground=DroneTheme.COLORS['bg_surface'],
+                highlightthickness=0
+            ).pack(side='left', padx=4)
         
         
         # AI status chip
@@ -982,28 +1706,38 @@ class DroneControlGUI:
     
     def execute_command(self, cmd_text, source):
         """Unified command execution for buttons, voice, and text with sequential processing."""
-        if not cmd_text or not cmd_text.strip():
+        if not cmd_text:
             return
             
         cmd_text_processed = cmd_text.strip().lower()
-        
-        # Log command with source
-        self.log(f"🎯 Command ({source}): {cmd_text_processed}")
+        if not cmd_text_processed:
+            return
         
         # Clear entry immediately (on GUI thread)
         if hasattr(self, 'command_entry') and source == "text":
             self.command_entry.delete(0, tk.END)
         
+        self._execute_normalized_command(cmd_text_processed, source)
+    
+    def _execute_normalized_command(self, cmd_text_processed, source):
+        """Execute a command that has already been stripped and lowercased."""
+        # Log command with source
+        self.log(f"🎯 Command ({source}): {cmd_text_processed}")
+        
         # Safety check - emergency should only be via header button
         if 'emergency' in cmd_text_processed or 'stop' in cmd_text_processed:
             self.log("⚠️ Use EMERGENCY button for safety stops")
             return
         
         # Handle special local commands that don't need drone agent
-        if cmd_text_processed == "test audio" or cmd_text_processed == "audio test":
+        local_command = LOCAL_COMMANDS.get(cmd_text_processed)
+        if local_command == 'test_audio':
             threading.Thread(target=self.test_audio_playback, daemon=True).start()
             return
-        elif cmd_text_processed == "test tts" or cmd_text_processed == "tts test":
+        elif local_command == 'audio_diagnostics':
+            self.test_audio_playback(full_diagnostics=True)
+            return
+        elif local_command == 'test_tts':
             self.speak_text("This is a test of the text to speech system. If you hear this, TTS is working correctly.")
             return
         
@@ -1033,36 +1767,19 @@ class DroneControlGUI:
         # Only consider properly formatted direct commands, not natural language
         
         # Basic commands without parameters
-        basic_commands = ['takeoff', 'land', 'flip', 'photo', 'picture', 'burst']
-        if cmd_text in basic_commands:
+        if cmd_text in BASIC_COMMANDS:
             return True
-            
-        # Commands with specific numeric parameters (properly formatted)
-        import re
         
-        # Movement commands: "forward 100", "back 50", etc.
-        if re.match(r'^(forward|back|left|right|up|down)\s+\d+$', cmd_text):
-            return True
-            
-        # Rotation commands: "cw 90", "ccw 45", etc.
-        if re.match(r'^(cw|ccw)\s+\d+$', cmd_text):
-            return True
-            
-        # Go command: "go 100 0 50 30" (x y z speed)
-        if re.match(r'^go\s+[-]?\d+\s+[-]?\d+\s+[-]?\d+\s+\d+$', cmd_text):
-            return True
-            
-        # Curve command: "curve x1 y1 z1 x2 y2 z2 speed"
-        if re.match(r'^curve\s+([-]?\d+\s+){6}\d+$', cmd_text):
-            return True
-            
-        # Photo with filename: "photo filename.jpg"
-        if re.match(r'^(photo|picture)\s+\S+$', cmd_text):
-            return True
-            
-        # Burst with parameters: "burst 5", "burst 3 2.0", etc.
-        if re.match(r'^burst(\s+\d+(\s+\d*\.?\d+(\s+\S+)?)?)?$', cmd_text):
-            return True
+        # Movement and rotation commands: "forward 100", "cw 90", etc.
+        if cmd_text.startswith(NUMERIC_COMMAND_PREFIXES):
+            argument = cmd_text.split(' ', 1)[1].lstrip()
+            if argument.isdigit():
+                return True
+        
+        # Go, curve, photo with filename and burst with parameters
+        for pattern in DIRECT_COMMAND_PATTERNS:
+            if pattern.match(cmd_text):
+                return True
         
         # If it doesn't match any of these patterns, it's natural language
         return False
@@ -1105,7 +1822,6 @@ class DroneControlGUI:
                                 
                                 # Queue the analyze_view command through the sequential processor
                                 # This ensures it runs AFTER all previous commands complete
-                                import json
                                 params = {"prompt": custom_prompt, "use_photo": use_photo}
                                 cmd_str = f"analyze_view {json.dumps(params)}"
                                 result = self.agent.execute_command(cmd_str, make_callback(i))
@@ -1171,11 +1887,11 @@ class DroneControlGUI:
                 return True  # Command was recognized, just not executable
             
             if any(phrase in cmd_text for phrase in ['describe what you see', 'what do you see', 'analyze view', 'analyze current view', 'describe view', 'describe what you see in the video', 'what do you see in the video', 'analyze the video', 'describe the video']):
-                threading.Thread(target=self.analyze_current_view, daemon=True).start()
+                self._bg_analyze()
                 return True
             elif any(phrase in cmd_text for phrase in ['analyze photo', 'describe photo', 'what\'s in photo']):
                 # For now, just analyze current view since we don't have photo selection
-                threading.Thread(target=self.analyze_current_view, daemon=True).start()
+                self._bg_analyze()
                 return True
             elif any(phrase in cmd_text for phrase in ['vision analysis', 'enable vision', 'start vision']):
                 self.log("🔍 Vision analysis is ready! Say 'describe what you see' to analyze the current view.")
@@ -1486,13 +2202,13 @@ class DroneControlGUI:
                 success = self.agent.connect()
                 
                 if success:
-                    self.message_queue.put(('connection_success', None))
+                    self.root.after_idle(self._on_connection_success)
                     self.log("✅ Connected successfully!")
                 else:
-                    self.message_queue.put(('connection_failed', None))
+                    self.root.after_idle(self._on_connection_failed)
                     self.log("❌ Connection failed")
             except Exception as e:
-                self.message_queue.put(('connection_error', str(e)))
+                self.root.after_idle(self._on_connection_failed)
                 self.log(f"❌ Connection error: {e}")
         
         threading.Thread(target=connect_thread, daemon=True).start()
@@ -1505,7 +2221,7 @@ class DroneControlGUI:
                 success = self.agent.connect()
                 
                 if success:
-                    self.message_queue.put(('connection_success', None))
+                    self.root.after_idle(self._on_connection_success)
                     self.log("✅ Simulation auto-connected!")
                     
                     # Auto-start video stream for photo capabilities
@@ -1538,14 +2254,19 @@ class DroneControlGUI:
     def toggle_simulation_mode(self):
         """Toggle between simulation and real-time drone mode."""
         if self.is_connected.get():
-            # Ask user if they want to proceed with mode switch while connected
-            result = messagebox.askyesno(
+            # Ask user if they want to proceed with mode switch while connected.
+            # The dialog is non-blocking so telemetry and log updates keep flowing.
+            self.show_confirm_dialog(
                 "Mode Switch Warning", 
-                "Switching modes will disconnect the current drone.\n\nDo you want to continue?"
+                "Switching modes will disconnect the current drone.\n\nDo you want to continue?",
+                self._start_mode_switch
             )
-            if not result:
-                return
+            return
         
+        self._start_mode_switch()
+    
+    def _start_mode_switch(self):
+        """Perform the mode switch after any confirmation has been given."""
         # Disable toggle button during switch
         self.mode_toggle_btn.config(state='disabled')
         
@@ -1594,6 +2315,7 @@ class DroneControlGUI:
                 # Set up callbacks for new agent
                 self.agent.vision_analysis_callback = self.thread_safe_vision_analysis
                 self.agent.daily_logger = self.daily_logger
+                self._bind_agent_methods()
                 
                 # Clean up old agent properly
                 try:
@@ -1631,28 +2353,34 @@ class DroneControlGUI:
                     self.show_toast_notification(f"❌ Mode switch failed: {e}", 'error')
                 ])
         
-        threading.Thread(target=mode_switch_thread, daemon=True).start()
+        self._cmd_q.put(mode_switch_thread)
     
     def _update_mode_ui(self):
-        """Update UI elements to reflect current mode."""
+        """Update UI elements to reflect current mode - only touches widgets whose state changed."""
         mode_text = "🎮 SIMULATION MODE" if self.simulation_mode else "🚁 REAL DRONE MODE"
-        self.mode_label.config(
-            text=mode_text,
-            fg=DroneTheme.COLORS['info'] if self.simulation_mode else DroneTheme.COLORS['accent_orange']
-        )
+        mode_changed = self.mode_label.cget('text') != mode_text
+        if mode_changed:
+            self.mode_label.config(
+                text=mode_text,
+                fg=DroneTheme.COLORS['info'] if self.simulation_mode else DroneTheme.COLORS['accent_orange']
+            )
         
-        # Reset connection status
-        self.is_connected.set(False)
-        self.is_flying.set(False)
-        self.connection_status.set("Disconnected")
+        # Reset connection status - Variable.set() fires traces even for equal values
+        if self.is_connected.get():
+            self.is_connected.set(False)
+        if self.is_flying.get():
+            self.is_flying.set(False)
+        if self.connection_status.get() != "Disconnected":
+            self.connection_status.set("Disconnected")
         self.video_running = False
         
         # Update control states
         self.update_control_states()
         
         # Show toast notification
-        mode_name = "Simulation" if self.simulation_mode else "Real-time"
-        self.show_toast_notification(f"🔄 Switched to {mode_name} mode!", 'info')
+        if mode_changed:
+            mode_name = "Simulation" if self.simulation_mode else "Real-time"
+            self.show_toast_notification(f"🔄 Switched to {mode_name} mode!", 'info')
     
     def emergency_stop(self):
         """Emergency stop the drone - IMMEDIATE ACTION for safety."""
@@ -1680,7 +2408,7 @@ class DroneControlGUI:
                 self.log("🚀 Taking off...")
                 success = self.agent.takeoff()
                 if success:
-                    self.message_queue.put(('takeoff_success', None))
+                    self.root.after_idle(self._on_takeoff_success)
                     self.log("✅ Takeoff successful!")
                 else:
                     self.log("❌ Takeoff failed")
@@ -1691,7 +2419,7 @@ class DroneControlGUI:
                 self.root.after(0, lambda: self.show_toast_notification(
                     f"❌ Takeoff error: {e}", 'error'))
         
-        threading.Thread(target=takeoff_thread, daemon=True).start()
+        self._cmd_q.put(takeoff_thread)
     
     def land(self):
         """Land the drone with confirmation."""
@@ -1709,7 +2437,7 @@ class DroneControlGUI:
                 self.log("🛬 Landing...")
                 success = self.agent.land()
                 if success:
-                    self.message_queue.put(('land_success', None))
+                    self.root.after_idle(self._on_land_success)
                     self.log("✅ Landing successful!")
                 else:
                     self.log("❌ Landing failed")
@@ -1720,14 +2448,62 @@ class DroneControlGUI:
                 self.root.after(0, lambda: self.show_toast_notification(
                     f"❌ Landing error: {e}", 'error'))
         
-        threading.Thread(target=land_thread, daemon=True).start()
+        # Like emergency stop, landing must not wait behind queued flight
+        # commands - drop them and land right away
+        self._drop_pending_commands()
+        self._cmd_pool.submit(land_thread)
+    
+    def _drop_pending_commands(self):
+        """Discard flight commands still waiting in the queue (the one running finishes)."""
+        dropped = 0
+        shutdown = False
+        while True:
+            try:
+                command_fn = self._cmd_q.get_nowait()
+            except queue.Empty:
+                break
+            if command_fn is None:
+                shutdown = True
+            else:
+                dropped += 1
+        if shutdown:
+            self._cmd_q.put(None)  # Keep the worker's shutdown sentinel
+        if dropped:
+            self.log(f"⚠️ Cancelled {dropped} queued command(s) for landing")
+    
+    def _command_worker(self):
+        """Run queued flight commands one at a time until a None sentinel arrives."""
+        while True:
+            command_fn = self._cmd_q.get()
+            if command_fn is None:
+                break
+            try:
+                command_fn()
+            except Exception as e:
+                self.log(f"❌ Command worker error: {e}")
+    
+    def _make_labeled_entry(self, parent, label, initial='', **entry_kwargs):
+        """Create a styled label + entry pair and return the entry."""
+        tk.Label(parent, text=label, **SETTINGS_LABEL_OPTIONS).pack(anchor='w', pady=(10, 2))
+        entry = tk.Entry(parent, **SETTINGS_ENTRY_OPTIONS, **entry_kwargs)
+        entry.pack(fill='x', pady=(0, 5))
+        entry.insert(0, initial)
+        return entry
+    
+    def _bind_agent_methods(self):
+        """Resolve agent methods used on hot control paths - call whenever self.agent is replaced."""
+        self._move_fns = {
+            direction: getattr(self.agent, f"move_{direction}")
+            for direction in ('forward', 'back', 'left', 'right', 'up', 'down')
+        }
+        self._has_hover = hasattr(self.agent, 'hover')
     
     def move(self, direction, distance=50):
         """Move the drone in specified direction."""
         def move_thread():
             try:
                 self.log(f"➡️ Moving {direction} {distance}cm...")
-                success = getattr(self.agent, f"move_{direction}")(distance)
+                success = self._move_fns[direction](distance)
                 if success:
                     self.log(f"✅ Moved {direction} successfully!")
                 else:
@@ -1739,7 +2515,7 @@ class DroneControlGUI:
         if self.is_connected.get():
             self.log(f"🔍 Debug: Connected={self.is_connected.get()}, Agent flying={self.agent.is_flying}")
             if self.agent.is_flying:
-                threading.Thread(target=move_thread, daemon=True).start()
+                self._cmd_q.put(move_thread)
             else:
                 self.log("❌ Drone must be flying to move")
         else:
@@ -1765,7 +2541,7 @@ class DroneControlGUI:
                 self.log(f"❌ Rotate {direction} error: {e}")
         
         if self.is_connected.get() and self.agent.is_flying:
-            threading.Thread(target=rotate_thread, daemon=True).start()
+            self._cmd_q.put(rotate_thread)
         else:
             self.log("❌ Drone must be connected and flying to rotate")
     
@@ -1774,7 +2550,7 @@ class DroneControlGUI:
         try:
             self.log("⏹️ Stopping movement...")
             # For Tello, this would be a hover command
-            if hasattr(self.agent, 'hover'):
+            if self._has_hover:
                 self.agent.hover(1)  # Hover for 1 second
             self.log("✅ Movement stopped")
         except Exception as e:
@@ -1797,10 +2573,7 @@ class DroneControlGUI:
                     # Only analyze the photo if explicitly requested
                     if analyze_vision and self.ai_enabled and filename:
                         self.log("🔍 Analyzing captured photo...")
-                        threading.Thread(
-                            target=lambda: self.analyze_captured_photo(filename),
-                            daemon=True
-                        ).start()
+                        self._vision_pool.submit(self.analyze_captured_photo, filename)
                 else:
                     self.log("❌ Photo failed")
                     self.root.after(0, lambda: self.show_toast_notification(
@@ -1809,7 +2582,7 @@ class DroneControlGUI:
                 self.log(f"❌ Photo error: {e}")
         
         if self.is_connected.get():
-            threading.Thread(target=photo_thread, daemon=True).start()
+            self._cmd_pool.submit(photo_thread)
         else:
             self.log("❌ Not connected to drone")
     
@@ -1828,7 +2601,7 @@ class DroneControlGUI:
                 self.log(f"❌ Burst photos error: {e}")
         
         if self.is_connected.get():
-            threading.Thread(target=burst_thread, daemon=True).start()
+            self._cmd_q.put(burst_thread)
         else:
             self.log("❌ Not connected to drone")
     
@@ -1854,6 +2627,7 @@ class DroneControlGUI:
         """Stop video stream."""
         try:
             self.video_running = False
+            self.latest_frame.clear()  # Don't paint a frame left over from the stream
             self.agent.stop_video_stream()
             self.video_btn.config(text="📹 Start Video", bg='#2196F3')
             self.log("⏹ Video stream stopped")
@@ -1865,20 +2639,19 @@ class DroneControlGUI:
         def video_loop():
             while self.video_running and self.is_connected.get():
                 try:
-                    frame = self.agent.get_current_frame()
+                    # Block until the capture thread delivers a new frame; the
+                    # timeout lets the loop notice when video is stopped
+                    frame = self.agent.get_current_frame(timeout=0.1)
                     if frame is not None:
-                        # Convert frame for tkinter display
-                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        frame_resized = cv2.resize(frame_rgb, (480, 360))
-                        
-                        # Convert to PIL Image and then to PhotoImage
-                        image_pil = Image.fromarray(frame_resized)
-                        photo = ImageTk.PhotoImage(image_pil)
+                        # Only resize here - the BGR->RGB swap is folded into the
+                        # PIL raw decode on the GUI thread, so there is no separate
+                        # colour-conversion pass. The resized array is handed to the
+                        # GUI thread, so it gets a fresh buffer each frame.
+                        frame_bgr = cv2.resize(frame, (480, 360), interpolation=cv2.INTER_AREA)
                         
-                        # Update video canvas
-                        self.message_queue.put(('video_frame', photo))
-                    
-                    time.sleep(0.03)  # ~30 FPS
+                        # Hand the frame to the GUI thread (replaces any undisplayed frame).
+                        # All Tk image work happens in process_messages on the main thread.
+                        self.latest_frame.append(frame_bgr)
                 except Exception as e:
                     self.log(f"❌ Video error: {e}")
                     break
@@ -1889,7 +2662,7 @@ class DroneControlGUI:
     def toggle_recording(self):
         """Toggle video recording."""
         try:
-            if hasattr(self.agent, 'recording') and self.agent.recording:
+            if self.agent.recording:
                 self.agent.stop_video_recording()
                 self.record_btn.config(text="⏺ Record", bg='#ff6600')
                 self.log("⏹ Recording stopped")
@@ -1967,7 +2740,7 @@ class DroneControlGUI:
                 self.log(f"❌ Detection photo error: {e}")
         
         if self.is_connected.get():
-            threading.Thread(target=detection_photo_thread, daemon=True).start()
+            self._cmd_pool.submit(detection_photo_thread)
         else:
             self.log("❌ Not connected to drone")
     
@@ -1996,122 +2769,161 @@ class DroneControlGUI:
                 self.log(f"❌ Command error: {e}")
         
         if self.is_connected.get():
-            threading.Thread(target=command_thread, daemon=True).start()
+            self._cmd_q.put(command_thread)
         else:
             self.log("❌ Not connected to drone")
     
     # Utility Methods
+    def _clock_text(self):
+        """Current time as HH:MM:SS, formatted at most once per second."""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._ts_cache[1]
+    
     def log(self, message, level="EVENT", component="GUI", data=None):
         """Enhanced logging with daily file storage and categorization."""
-        timestamp = time.strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
+        log_message = f"[{self._clock_text()}] {message}\n"
+        
+        # Thread-safe GUI log update, drained by process_messages
+        self.gui_log_queue.put(log_message)
+        
+        # Structured daily logging happens on the logger thread
+        mode = "SIMULATION" if self.simulation_mode else "REALTIME"
+        self._log_q.put((mode, component, message, data))
+    
+    def log_many(self, messages, component="GUI"):
+        """Log several related messages as one block with a shared timestamp."""
+        timestamp = self._clock_text()
         
-        # Thread-safe GUI log update (unchanged for backward compatibility)
-        self.message_queue.put(('log', log_message))
+        # One queue item for the GUI, so the lines always land in the same insert
+        self.gui_log_queue.put(''.join(f"[{timestamp}] {message}\n" for message in messages))
         
-        # Enhanced daily logging based on message content and level
         mode = "SIMULATION" if self.simulation_mode else "REALTIME"
+        for message in messages:
+            self._log_q.put((mode, component, message, None))
+    
+    def _daily_log_worker(self):
+        """Drain queued log records into the daily logger until a None sentinel arrives."""
+        while True:
+            record = self._log_q.get()
+            if record is None:
+                break
+            try:
+                self._write_daily_log(*record)
+            except Exception as e:
+                print(f"⚠️ Daily log write failed: {e}")
+    
+    def _write_daily_log(self, mode, component, message, data):
+        """Categorize a GUI log message and write it to the daily log."""
+        gui_message = message.strip()
+        
+        # Status emoji prefix decides the level directly, otherwise one lowercase keyword pass
+        level = LOG_LEVEL_BY_PREFIX.get(gui_message[:1])
+        if level:
+            text = gui_message[1:].lstrip('\ufe0f').strip()
+        else:
+            text = gui_message
+            msg_lower = gui_message.lower()
+            if 'error' in msg_lower or 'failed' in msg_lower:
+                level = 'failure'
+            elif 'warning' in msg_lower:
+                level = 'warning'
+            elif 'successful' in msg_lower or 'connected' in msg_lower:
+                level = 'success'
+        
+        log_data = {"gui_message": gui_message}
+        if level == 'success':
+            log_data["success"] = True
+        if data:
+            log_data.update(data)
         
-        # Categorize messages based on content for structured logging
-        if "❌" in message or "error" in message.lower() or "failed" in message.lower():
-            # Extract error details
-            error_data = {"gui_message": message.strip()}
-            if data:
-                error_data.update(data)
-            self.daily_logger.log_failure(component, message.replace("❌", "").strip(), mode, data=error_data)
-        elif "⚠️" in message or "warning" in message.lower():
-            # Warning messages
-            warning_data = {"gui_message": message.strip()}
-            if data:
-                warning_data.update(data)
-            self.daily_logger.log_warning(component, message.replace("⚠️", "").strip(), mode, warning_data)
-        elif "✅" in message or "successful" in message.lower() or "connected" in message.lower():
-            # Success events
-            event_data = {"gui_message": message.strip(), "success": True}
-            if data:
-                event_data.update(data)
-            self.daily_logger.log_event(component, message.replace("✅", "").strip(), mode, event_data)
+        if level == 'failure':
+            self.daily_logger.log_failure(component, text, mode, data=log_data)
+        elif level == 'warning':
+            self.daily_logger.log_warning(component, text, mode, log_data)
         else:
-            # General events
-            event_data = {"gui_message": message.strip()}
-            if data:
-                event_data.update(data)
-            self.daily_logger.log_event(component, message.strip(), mode, event_data)
+            self.daily_logger.log_event(component, text, mode, log_data)
+    
+    def _on_connection_success(self):
+        """Handle a successful connection (scheduled on the Tk thread by workers)."""
+        self.is_connected.set(True)
+        self.connection_status.set("Connected")
+        self._ctrl_dirty = True
+        self._battery_cache = (0.0, None)  # Fresh reading for the new connection
+        self._poll_battery()
+        self.show_toast_notification("✅ Connected to drone!", 'success')
+    
+    def _on_connection_failed(self):
+        """Handle a failed connection attempt (scheduled on the Tk thread by workers)."""
+        self.is_connected.set(False)
+        self.connection_status.set("Failed")
+        self._ctrl_dirty = True
+        self.show_toast_notification("❌ Connection failed", 'error')
+    
+    def _on_takeoff_success(self):
+        """Handle a successful takeoff (scheduled on the Tk thread by workers)."""
+        self.is_flying.set(True)
+        self.status_flying.config(text="Yes", fg=DroneTheme.COLORS['accent_green'])
+        self._ctrl_dirty = True
+        self.show_toast_notification("🚀 Takeoff successful!", 'success')
+    
+    def _on_land_success(self):
+        """Handle a successful landing (scheduled on the Tk thread by workers)."""
+        self.is_flying.set(False)
+        self.status_flying.config(text="No", fg=DroneTheme.COLORS['accent_orange'])
+        self._ctrl_dirty = True
+        self.show_toast_notification("🛬 Landing successful!", 'success')
     
     def process_messages(self):
-        """Process messages from background threads."""
+        """Process log lines and video frames from background threads."""
+        # Log lines are collected and written with a single insert per tick
+        log_chunks = []
         try:
             while True:
-                message_type, data = self.message_queue.get_nowait()
-                
-                if message_type == 'log':
-                    self.log_text.insert(tk.END, data)
-                    self.log_text.see(tk.END)
-                
-                elif message_type == 'video_frame':
-                    self.video_canvas.delete("all")
-                    self.video_canvas.create_image(240, 180, image=data)
-                    self.video_frame = data  # Keep reference
-                
-                elif message_type == 'connection_success':
-                    self.is_connected.set(True)
-                    self.connection_status.set("Connected")
-                    self.update_control_states()  # Update all button states
-                    self.show_toast_notification("✅ Connected to drone!", 'success')
-                
-                elif message_type == 'connection_failed':
-                    self.is_connected.set(False)
-                    self.connection_status.set("Failed")
-                    self.update_control_states()  # Update all button states
-                    self.show_toast_notification("❌ Connection failed", 'error')
-                
-                elif message_type == 'takeoff_success':
-                    self.is_flying.set(True)
-                    self.status_flying.config(text="Yes", fg=DroneTheme.COLORS['accent_green'])
-                    self.update_control_states()  # Update all button states
-                    self.show_toast_notification("🚀 Takeoff successful!", 'success')
-                
-                elif message_type == 'land_success':
-                    self.is_flying.set(False)
-                    self.status_flying.config(text="No", fg=DroneTheme.COLORS['accent_orange'])
-                    self.update_control_states()  # Update all button states
-                    self.show_toast_notification("🛬 Landing successful!", 'success')
-                
+                log_chunks.append(self.gui_log_queue.get_nowait())
         except queue.Empty:
             pass
         
-        # Process voice commands if available
-        if VOICE_AVAILABLE and self.voice_command_queue:
-            try:
-                while True:
-                    voice_command = self.voice_command_queue.get_nowait()
-                    self.process_voice_command(voice_command)
-            except queue.Empty:
-                pass
+        # Apply button state changes once per tick, however many events arrived
+        if self._ctrl_dirty:
+            self._ctrl_dirty = False
+            self.update_control_states()
         
-        # Schedule next check
-        self.root.after(50, self.process_messages)
+        if log_chunks:
+            self.log_text.insert(tk.END, ''.join(log_chunks))
+            self._prune_log_text()
+            self.log_text.see(tk.END)
+        
+        # Display the newest video frame, if one arrived since the last tick
+        try:
+            frame_bgr = self.latest_frame.popleft()
+            # 'BGR' raw mode swaps channels while PIL copies the buffer
+            pil_frame = Image.frombuffer('RGB', (480, 360), frame_bgr, 'raw', 'BGR', 0, 1)
+            self._video_photo.paste(pil_frame)
+            self.video_frame = self._video_photo
+            self._last_pil_frame = pil_frame
+        except IndexError:
+            pass
+        
+        # Schedule next check - only poll at the fast rate while video is running
+        self.root.after(VIDEO_POLL_MS if self.video_running else MESSAGE_POLL_MS, self.process_messages)
+    
+    def _prune_log_text(self):
+        """Drop the oldest activity log lines once the log grows past LOG_MAX_LINES."""
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > LOG_MAX_LINES:
+            self.log_text.delete('1.0', f'{line_count - LOG_MAX_LINES + LOG_PRUNE_LINES}.0')
     
     def update_status(self):
-        """Update drone status periodically."""
+        """Update drone flying status periodically."""
         if self.is_connected.get():
             try:
-                # Update battery level
-                battery = self.agent.drone.get_battery()
-                if battery is not None:
-                    self.battery_level.set(f"{battery}%")
-                    
-                    # Change color based on battery level
-                    if battery > 30:
-                        self.status_battery.config(fg='#00ff00')
-                    elif battery > 15:
-                        self.status_battery.config(fg='#ff6600')
-                    else:
-                        self.status_battery.config(fg='#ff0000')
-                
                 # Update flying status
-                if hasattr(self.agent, 'is_flying'):
-                    if self.agent.is_flying:
+                is_flying = self.agent.is_flying
+                if is_flying != self._last_flying_status:
+                    self._last_flying_status = is_flying
+                    if is_flying:
                         self.status_flying.config(text="Yes", fg='#00ff00')
                     else:
                         self.status_flying.config(text="No", fg='#ff6600')
@@ -2123,13 +2935,58 @@ class DroneControlGUI:
         self.update_control_states()
         
         # Schedule next update
-        self.root.after(2000, self.update_status)  # Update every 2 seconds
+        self.root.after(STATUS_POLL_MS, self.update_status)
+    
+    def update_battery(self):
+        """Update battery level periodically - runs on a slower schedule than update_status."""
+        self._poll_battery()
+        
+        # Schedule next update
+        self.root.after(BATTERY_POLL_MS, self.update_battery)
+    
+    def _poll_battery(self):
+        """Read the battery level, reusing the cached reading until it is BATTERY_POLL_MS old."""
+        if not self.is_connected.get():
+            return
+        
+        try:
+            last_polled, last_battery = self._battery_cache
+            now = time.time()
+            if (now - last_polled) * 1000 < BATTERY_POLL_MS:
+                return
+            
+            # Stamped before the request, so the age measures poll start to poll
+            # start and the next update_battery tick always finds it expired
+            battery = self.agent.drone.get_battery()
+            self._battery_cache = (now, battery)
+            
+            # Only touch the widgets when the reading actually changed
+            if battery is not None and battery != last_battery:
+                self.battery_level.set(f"{battery}%")
+                
+                # Change color based on battery level
+                if battery > 30:
+                    self.status_battery.config(fg='#00ff00')
+                elif battery > 15:
+                    self.status_battery.config(fg='#ff6600')
+                else:
+                    self.status_battery.config(fg='#ff0000')
+            
+        except Exception as e:
+            pass  # Ignore status update errors
     
     def update_control_states(self):
         """Update button states and appearance based on drone status - state-aware UI"""
         try:
             is_connected = self.is_connected.get()
-            is_flying = self.is_flying.get() if hasattr(self, 'is_flying') else False
+            is_flying = self.is_flying.get()
+            
+            # Nothing to do if the state hasn't changed since the last update
+            state_key = (is_connected, is_flying)
+            if state_key == self._last_ctrl_state:
+                return
+            self._last_ctrl_state = state_key
+            disabled_bg = DroneTheme.COLORS['text_disabled']
             
             # Connection button - always available
             if is_connected:
@@ -2146,98 +3003,89 @@ class DroneControlGUI:
             else:
                 self.emergency_btn.config(
                     state='disabled',
-                    bg=DroneTheme.COLORS['text_disabled'],
+                    bg=disabled_bg,
                     cursor='arrow'
                 )
             
             # Flight control buttons
-            if hasattr(self, 'takeoff_btn'):
-                if is_connected and not is_flying:
-                    # Can takeoff - enabled and green
-                    DroneTheme.apply_button_style(self.takeoff_btn, 'success')
-                    self.takeoff_btn.config(state='normal')
-                elif is_connected and is_flying:
-                    # Already flying - disabled but show state
-                    self.takeoff_btn.config(
-                        state='disabled',
-                        bg=DroneTheme.COLORS['text_disabled'],
-                        cursor='arrow'
-                    )
-                else:
-                    # Not connected - disabled
-                    self.takeoff_btn.config(
-                        state='disabled',
-                        bg=DroneTheme.COLORS['text_disabled'],
-                        cursor='arrow'
-                    )
+            if is_connected and not is_flying:
+                # Can takeoff - enabled and green
+                DroneTheme.apply_button_style(self.takeoff_btn, 'success')
+                self.takeoff_btn.config(state='normal')
+            elif is_connected and is_flying:
+                # Already flying - disabled but show state
+                self.takeoff_btn.config(
+                    state='disabled',
+                    bg=disabled_bg,
+                    cursor='arrow'
+                )
+            else:
+                # Not connected - disabled
+                self.takeoff_btn.config(
+                    state='disabled',
+                    bg=disabled_bg,
+                    cursor='arrow'
+                )
             
-            if hasattr(self, 'land_btn'):
-                if is_connected and is_flying:
-                    # Can land - enabled and orange
-                    DroneTheme.apply_button_style(self.land_btn, 'accent_orange')
-                    self.land_btn.config(state='normal')
-                elif is_connected and not is_flying:
-                    # Not flying - disabled but show state
-                    self.land_btn.config(
-                        state='disabled',
-                        bg=DroneTheme.COLORS['text_disabled'],
-                        cursor='arrow'
-                    )
-                else:
-                    # Not connected - disabled
-                    self.land_btn.config(
-                        state='disabled',
-                        bg=DroneTheme.COLORS['text_disabled'],
-                        cursor='arrow'
-                    )
+            if is_connected and is_flying:
+                # Can land - enabled and orange
+                DroneTheme.apply_button_style(self.land_btn, 'accent_orange')
+                self.land_btn.config(state='normal')
+            elif is_connected and not is_flying:
+                # Not flying - disabled but show state
+                self.land_btn.config(
+                    state='disabled',
+                    bg=disabled_bg,
+                    cursor='arrow'
+                )
+            else:
+                # Not connected - disabled
+                self.land_btn.config(
+                    state='disabled',
+                    bg=disabled_bg,
+                    cursor='arrow'
+                )
             
             # Video controls - only enabled when connected
-            if hasattr(self, 'video_btn'):
-                if is_connected:
-                    DroneTheme.apply_button_style(self.video_btn, 'primary')
-                    self.video_btn.config(state='normal')
-                else:
-                    self.video_btn.config(
-                        state='disabled',
-                        bg=DroneTheme.COLORS['text_disabled'],
-                        cursor='arrow'
-                    )
+            if is_connected:
+                DroneTheme.apply_button_style(self.video_btn, 'primary')
+                self.video_btn.config(state='normal')
+            else:
+                self.video_btn.config(
+                    state='disabled',
+                    bg=disabled_bg,
+                    cursor='arrow'
+                )
             
-            if hasattr(self, 'record_btn'):
+            if is_connected:
+                DroneTheme.apply_button_style(self.record_btn, 'accent_orange')
+                self.record_btn.config(state='normal')
+            else:
+                self.record_btn.config(
+                    state='disabled',
+                    bg=disabled_bg,
+                    cursor='arrow'
+                )
+            
+            # Vision and AI controls - only enabled when connected
+            for btn in self._connection_dependent_buttons:
                 if is_connected:
-                    DroneTheme.apply_button_style(self.record_btn, 'accent_orange')
-                    self.record_btn.config(state='normal')
+                    btn.config(state='normal', cursor='hand2')
                 else:
-                    self.record_btn.config(
+                    btn.config(
                         state='disabled',
-                        bg=DroneTheme.COLORS['text_disabled'],
                         cursor='arrow'
                     )
             
-            # Vision and AI controls - only enabled when connected
-            connection_dependent_buttons = ['execute_btn', 'vision_analyze_btn', 'continuous_vision_btn']
-            for btn_name in connection_dependent_buttons:
-                if hasattr(self, btn_name):
-                    btn = getattr(self, btn_name)
-                    if is_connected:
-                        btn.config(state='normal')
-                        # Restore original cursor
-                        btn.config(cursor='hand2')
-                    else:
-                        btn.config(
-                            state='disabled',
-                            cursor='arrow'
-                        )
-            
             # Voice button - depends on connection and voice availability
-            if hasattr(self, 'voice_btn') and VOICE_AVAILABLE:
+            if self._voice_btn is not None:
                 if is_connected:
-                    DroneTheme.apply_button_style(self.voice_btn, 'primary')
-                    self.voice_btn.config(state='normal')
+                    DroneTheme.apply_button_style(self._voice_btn, 'primary')
+                    self._voice_btn.config(state='normal')
                 else:
-                    self.voice_btn.config(
+                    self._voice_btn.config(
                         state='disabled',
-                        bg=DroneTheme.COLORS['text_disabled'],
+                        bg=disabled_bg,
                         cursor='arrow'
                     )
             
@@ -2245,44 +3093,71 @@ class DroneControlGUI:
             # Silently handle control state update errors
             pass
     
+    def _queue_ui_op(self, op):
+        """Queue a UI mutation to run with the others from this event-loop turn."""
+        self._pending_ui_ops.append(op)
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            self.root.after_idle(self._flush_ui_ops)
+    
+    def _flush_ui_ops(self):
+        """Run all queued UI mutations, then redraw once."""
+        ops, self._pending_ui_ops = self._pending_ui_ops, []
+        self._ui_flush_scheduled = False
+        for op in ops:
+            try:
+                op()
+            except tk.TclError:
+                pass  # Widget was destroyed before the flush ran
+            except Exception as e:
+                self.log(f"❌ UI update error: {e}")
+        self.root.update_idletasks()
+    
+    def _schedule_ui_timer(self, delay_ms, op):
+        """Queue a UI mutation to run after delay_ms on the shared UI timer."""
+        deadline = time.monotonic() + delay_ms / 1000
+        heapq.heappush(self._ui_timers, (deadline, next(self._ui_timer_seq), op))
+        if not self._ui_timer_running:
+            self._ui_timer_running = True
+            self.root.after(UI_TIMER_TICK_MS, self._ui_timer_tick)
+    
+    def _ui_timer_tick(self):
+        """Hand expired timers to the UI flush; keeps ticking only while timers are pending."""
+        now = time.monotonic()
+        while self._ui_timers and self._ui_timers[0][0] <= now:
+            self._queue_ui_op(heapq.heappop(self._ui_timers)[2])
+        
+        if self._ui_timers:
+            self.root.after(UI_TIMER_TICK_MS, self._ui_timer_tick)
+        else:
+            self._ui_timer_running = False
+    
     def show_flash_effect(self):
         """Show camera flash effect on the video canvas"""
-        if hasattr(self, 'video_canvas'):
-            try:
-                # Create white flash overlay
-                flash_rect = self.video_canvas.create_rectangle(
-                    0, 0, 480, 360, 
-                    fill='white', 
-                    outline='', 
-                    stipple='gray50'
-                )
-                
-                # Remove flash after short delay
-                def remove_flash():
-                    try:
-                        self.video_canvas.delete(flash_rect)
-                    except:
-                        pass
-                
-                self.root.after(150, remove_flash)  # Flash for 150ms
-            except:
-                pass  # Silently handle flash errors
+        # Reveal the long-lived flash overlay instead of creating a new item;
+        # both steps run through the UI flush, which tolerates a destroyed canvas
+        self._queue_ui_op(lambda: self.video_canvas.itemconfigure(self._flash_item, state='normal'))
+        
+        # Hide flash after short delay
+        self._schedule_ui_timer(150, lambda: self.video_canvas.itemconfigure(self._flash_item, state='hidden'))
     
     def show_toast_notification(self, message, message_type='info', duration=3000):
         """Show temporary status notification overlay"""
+        colors = DroneTheme.COLORS
+        spacing = DroneTheme.SPACING
         try:
-            # Create toast container if it doesn't exist
-            if not hasattr(self, 'toast_container'):
-                self.toast_container = tk.Frame(self.root, bg=DroneTheme.COLORS['bg_root'])
+            # Show the toast container if it's currently hidden
+            if not self._toast_visible:
                 self.toast_container.place(relx=0.5, rely=0.9, anchor='center')
+                self._toast_visible = True
             
             # Color based on message type
             bg_color = {
-                'success': DroneTheme.COLORS['success'],
-                'error': DroneTheme.COLORS['danger'], 
-                'warning': DroneTheme.COLORS['warning'],
-                'info': DroneTheme.COLORS['info']
-            }.get(message_type, DroneTheme.COLORS['info'])
+                'success': colors['success'],
+                'error': colors['danger'], 
+                'warning': colors['warning'],
+                'info': colors['info']
+            }.get(message_type, colors['info'])
             
             # Create toast notification
             toast = tk.Label(
@@ -2290,37 +3165,37 @@ class DroneControlGUI:
                 text=message,
                 font=DroneTheme.get_font('base', 'bold'),
                 bg=bg_color,
-                fg=DroneTheme.COLORS['text_primary'],
-                padx=DroneTheme.SPACING['lg'],
-                pady=DroneTheme.SPACING['sm'],
+                fg=colors['text_primary'],
+                padx=spacing['lg'],
+                pady=spacing['sm'],
                 relief='flat'
             )
-            toast.pack(pady=DroneTheme.SPACING['xs'])
+            toast.pack(pady=spacing['xs'])
             
             # Auto-remove after duration
             def remove_toast():
-                try:
-                    toast.destroy()
-                    # Remove container if no more toasts
-                    if not self.toast_container.winfo_children():
-                        self.toast_container.place_forget()
-                except:
-                    pass
+                toast.destroy()
+                # Hide container if no more toasts
+                if not self.toast_container.winfo_children():
+                    self.toast_container.place_forget()
+                    self._toast_visible = False
             
-            self.root.after(duration, remove_toast)
+            self._schedule_ui_timer(duration, remove_toast)
             
-        except Exception as e:
+        except tk.TclError:
             # Fallback to log if toast fails
             self.log(f"📢 {message}")
     
     def show_progress_dialog(self, title, max_steps=0):
         """Show progress dialog for long operations"""
+        colors = DroneTheme.COLORS
+        spacing = DroneTheme.SPACING
         try:
             # Create progress window
             progress_window = tk.Toplevel(self.root)
             progress_window.title(title)
             progress_window.geometry("400x150")
-            progress_window.configure(bg=DroneTheme.COLORS['bg_surface'])
+            progress_window.configure(bg=colors['bg_surface'])
             progress_window.resizable(False, False)
             
             # Center on parent
@@ -2329,84 +3204,107 @@ class DroneControlGUI:
             
             # Progress content
             main_frame = DroneTheme.create_styled_frame(progress_window, 'bg_surface')
-            main_frame.pack(fill='both', expand=True, padx=DroneTheme.SPACING['xl'], 
-                          pady=DroneTheme.SPACING['xl'])
+            main_frame.pack(fill='both', expand=True, padx=spacing['xl'], 
+                          pady=spacing['xl'])
             
             # Title label
             title_label = tk.Label(
                 main_frame,
                 text=title,
                 font=DroneTheme.get_font('lg', 'bold'),
-                fg=DroneTheme.COLORS['text_primary'],
-                bg=DroneTheme.COLORS['bg_surface']
+                fg=colors['text_primary'],
+                bg=colors['bg_surface']
             )
-            title_label.pack(pady=(0, DroneTheme.SPACING['md']))
+            title_label.pack(pady=(0, spacing['md']))
             
             # Progress bar (using canvas for custom styling)
-            progress_frame = tk.Frame(main_frame, bg=DroneTheme.COLORS['bg_surface'])
-            progress_frame.pack(fill='x', pady=DroneTheme.SPACING['md'])
+            progress_frame = tk.Frame(main_frame, bg=colors['bg_surface'])
+            progress_frame.pack(fill='x', pady=spacing['md'])
             
             progress_canvas = tk.Canvas(
                 progress_frame, 
                 height=8, 
-                bg=DroneTheme.COLORS['bg_input'],
+                bg=colors['bg_input'],
                 highlightthickness=0
             )
             progress_canvas.pack(fill='x')
             
+            # Fill bar is created once and resized via coords() on each update;
+            # the canvas width is tracked from <Configure> instead of queried per update
+            progress_window._bar_id = progress_canvas.create_rectangle(
+                0, 0, 0, 8,
+                fill=colors['primary'],
+                outline=''
+            )
+            # Until the first <Configure>, assume the fixed 400px window minus frame padding
+            progress_window._bar_width = 400 - 2 * spacing['xl']
+            
+            def on_canvas_configure(event):
+                progress_window._bar_width = event.width
+            
+            progress_canvas.bind('<Configure>', on_canvas_configure)
+            
             # Status label
             status_label = tk.Label(
                 main_frame,
                 text="Starting...",
                 font=DroneTheme.get_font('sm'),
-                fg=DroneTheme.COLORS['text_muted'],
-                bg=DroneTheme.COLORS['bg_surface']
+                fg=colors['text_muted'],
+                bg=colors['bg_surface']
             )
-            status_label.pack(pady=(DroneTheme.SPACING['md'], 0))
+            status_label.pack(pady=(spacing['md'], 0))
             
             # Store references for updates
             progress_window.progress_canvas = progress_canvas
             progress_window.status_label = status_label
             progress_window.max_steps = max_steps
             progress_window.current_step = 0
+            progress_window._last_text = status_label.cget('text')
             
             return progress_window
             
-        except Exception as e:
+        except tk.TclError:
             return None
     
     def update_progress(self, progress_window, step_text, step_number=None):
-        """Update progress dialog"""
+        """Update progress dialog.
+        
+        The change is drawn on the next idle flush rather than by pumping the
+        event loop, so long operations should run their steps on a worker
+        thread (or yield to the mainloop between steps) to see it appear.
+        """
         if not progress_window or not progress_window.winfo_exists():
             return
+        
+        # Skip repeated calls that wouldn't change what's on screen
+        text_changed = step_text != progress_window._last_text
+        step_changed = (step_number is not None and progress_window.max_steps > 0
+                        and step_number != progress_window.current_step)
+        if not (text_changed or step_changed):
+            return
+        progress_window._last_text = step_text
+        if step_changed:
+            progress_window.current_step = step_number
+            
+        def apply_progress():
+            if not progress_window.winfo_exists():
+                return
             
-        try:
             # Update status text
-            progress_window.status_label.config(text=step_text)
+            if text_changed:
+                progress_window.status_label.config(text=step_text)
             
-            # Update progress bar if step number provided
-            if step_number is not None and progress_window.max_steps > 0:
-                progress_window.current_step = step_number
+            # Update progress bar if step number changed
+            if step_changed:
                 progress = min(step_number / progress_window.max_steps, 1.0)
                 
-                # Clear and redraw progress bar
-                canvas = progress_window.progress_canvas
-                canvas.delete("all")
-                width = canvas.winfo_width()
-                fill_width = int(width * progress)
-                
-                if fill_width > 0:
-                    canvas.create_rectangle(
-                        0, 0, fill_width, 8,
-                        fill=DroneTheme.COLORS['primary'],
-                        outline=''
-                    )
-            
-            # Force update
-            progress_window.update()
-            
-        except Exception as e:
-            pass
+                # Resize the existing fill bar
+                fill_width = int(progress_window._bar_width * progress)
+                progress_window.progress_canvas.coords(
+                    progress_window._bar_id, 0, 0, fill_width, 8)
+        
+        # Applied with other pending UI work in one flush instead of forcing update()
+        self._queue_ui_op(apply_progress)
     
     def close_progress(self, progress_window):
         """Close progress dialog"""
@@ -2414,8 +3312,57 @@ class DroneControlGUI:
             try:
                 progress_window.grab_release()
                 progress_window.destroy()
-            except:
+            except tk.TclError:
+                pass  # Window went away between the check and the destroy
+    
+    def show_confirm_dialog(self, title, message, on_confirm, on_cancel=None):
+        """Show a non-blocking Yes/No dialog and run a continuation with the answer.
+        
+        Unlike messagebox.askyesno this returns immediately, so the Tk event
+        loop keeps processing log, video and status updates while it is open.
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.configure(bg=DroneTheme.COLORS['bg_surface'])
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        tk.Label(
+            dialog,
+            text=message,
+            font=DroneTheme.get_font('base'),
+            fg=DroneTheme.COLORS['text_primary'],
+            bg=DroneTheme.COLORS['bg_surface'],
+            justify='left',
+            wraplength=360
+        ).pack(padx=DroneTheme.SPACING['xl'], pady=DroneTheme.SPACING['xl'])
+        
+        button_row = tk.Frame(dialog, bg=DroneTheme.COLORS['bg_surface'])
+        button_row.pack(pady=(0, DroneTheme.SPACING['lg']))
+        
+        def answer(confirmed):
+            try:
+                dialog.grab_release()
+                dialog.destroy()
+            except tk.TclError:
                 pass
+            continuation = on_confirm if confirmed else on_cancel
+            if continuation:
+                continuation()
+        
+        yes_btn = tk.Button(button_row, text="Yes", width=8, command=lambda: answer(True))
+        DroneTheme.apply_button_style(yes_btn, 'primary')
+        yes_btn.pack(side='left', padx=DroneTheme.SPACING['xs'])
+        
+        no_btn = tk.Button(button_row, text="No", width=8, command=lambda: answer(False))
+        DroneTheme.apply_button_style(no_btn, 'bg_elevated')
+        no_btn.pack(side='left', padx=DroneTheme.SPACING['xs'])
+        
+        dialog.protocol("WM_DELETE_WINDOW", lambda: answer(False))
+        dialog.bind('<Escape>', lambda e: answer(False))
+        no_btn.focus_set()
+        return dialog
     
     def deferred_setup(self):
         """Initialize voice and AI systems after GUI is ready."""
@@ -2424,7 +3371,7 @@ class DroneControlGUI:
             self.setup_azure_openai()
             
         # Auto-connect simulation mode after GUI is fully initialized
-        if hasattr(self, 'pending_auto_connect') and self.pending_auto_connect:
+        if self.pending_auto_connect:
             self.auto_connect_simulation()
             
         # Voice setup note: microphone will be initialized when user clicks voice button
@@ -2436,6 +3383,10 @@ class DroneControlGUI:
             return False
             
         try:
+            _load_speech_recognition()
+            if self.recognizer is None:
+                self.recognizer = sr.Recognizer()
+            
             # Test microphone availability (this can block/fail)
             self.microphone = sr.Microphone()
             
@@ -2460,8 +3411,10 @@ class DroneControlGUI:
             if not VOICE_AVAILABLE:
                 self.log("❌ Voice commands unavailable - speech_recognition not installed")
             else:
-                self.log("❌ Voice commands unavailable - no microphone detected")
-                self.log("💡 TIP: Make sure you're running on your local machine, not in cloud")
+                self.log_many([
+                    "❌ Voice commands unavailable - no microphone detected",
+                    "💡 TIP: Make sure you're running on your local machine, not in cloud",
+                ])
             return
         
         if self.voice_enabled:
@@ -2474,116 +3427,167 @@ class DroneControlGUI:
         try:
             self.voice_enabled = True
             self.voice_running = True
+            self._voice_stop = threading.Event()  # Fresh event per session; the loop keeps its own reference
+            self._voice_backoff = 0.0
+            self._pending_audio = collections.deque(maxlen=VOICE_PENDING_AUDIO)
+            self._dropped_audio = 0
+            self._recog_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=VOICE_RECOGNITION_WORKERS, thread_name_prefix='voice_recog')
             self.voice_thread = threading.Thread(target=self.voice_recognition_loop, daemon=True)
             self.voice_thread.start()
             
             self.voice_btn.config(text="🔇 Stop Voice", bg='#f44336')
             self.voice_status_label.config(text="Voice: Listening...", fg='#4CAF50')
-            self.log("🎤 Voice recognition enabled!")
-            self.log("💬 Say: 'take off', 'land', 'take photo', 'move forward'")
+            self.log_many([
+                "🎤 Voice recognition enabled!",
+                "💬 Say: 'take off', 'land', 'take photo', 'move forward'",
+            ])
             
         except Exception as e:
             self.log(f"❌ Failed to start voice recognition: {e}")
             self.voice_enabled = False
     
     def stop_voice(self):
-        """Stop voice recognition."""
+        """Stop voice recognition - signals the loop and returns without waiting for it."""
         try:
             self.voice_enabled = False
             self.voice_running = False
+            self._voice_stop.set()
             
-            if self.voice_thread and self.voice_thread.is_alive():
-                self.voice_thread.join(timeout=2)
-            
-            self.voice_btn.config(text="🎤 Voice Commands", bg='#00BCD4')
-            self.voice_status_label.config(text="Voice: Off", fg='#cccccc')
-            self.log("🎤 Voice recognition disabled")
+            # The loop exits once its current listen() times out; keep the button
+            # disabled until then so a restart can't grab the microphone twice
+            self.voice_btn.config(text="⏳ Stopping...", state='disabled')
+            self.voice_status_label.config(text="Voice: Stopping...", fg='#cccccc')
+            self._finalize_voice_stop()
             
         except Exception as e:
             self.log(f"❌ Failed to stop voice recognition: {e}")
     
+    def _on_voice_offline_toggle(self):
+        """Mirror the "Listen offline" checkbox into the flag read by the voice thread."""
+        self.voice_when_disconnected = self.voice_offline_var.get()
+    
+    def _finalize_voice_stop(self):
+        """Restore the voice controls once the recognition thread has exited."""
+        if self.voice_thread and self.voice_thread.is_alive():
+            self.root.after(100, self._finalize_voice_stop)
+            return
+        
+        self.voice_btn.config(text="🎤 Voice Commands", bg='#00BCD4', state='normal')
+        self.voice_status_label.config(text="Voice: Off", fg='#cccccc')
+        self.log("🎤 Voice recognition disabled")
+    
     def voice_recognition_loop(self):
-        """Voice recognition loop running in separate thread."""
-        while self.voice_running:
+        """Voice recognition loop running in separate thread - only listens, recognition runs on _recog_pool."""
+        stop_event = self._voice_stop
+        recog_pool = self._recog_pool  # This session's pool - only this thread submits to it
+        try:
+            self._listen_for_commands(stop_event, recog_pool)
+        finally:
+            # Shut the pool down here rather than in stop_voice, so a listen()
+            # that returns after stop can never submit to a closed pool
+            recog_pool.shutdown(wait=False)
+    
+    def _listen_for_commands(self, stop_event, recog_pool):
+        """Listen until stop_event is set, handing each clip to recog_pool."""
+        while not stop_event.is_set():
             try:
+                # Back off after recognition service errors (wakes early on stop)
+                if self._voice_backoff and stop_event.wait(self._voice_backoff):
+                    break
+                
                 with self.microphone as source:
                     # Adjust for ambient noise initially
-                    if not hasattr(self, 'noise_adjusted'):
+                    if not self.noise_adjusted:
                         self.recognizer.adjust_for_ambient_noise(source, duration=1)
                         self.noise_adjusted = True
                     
                     # Listen for audio
                     audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=5)
                 
-                # Recognize speech
-                command = self.recognizer.recognize_google(audio)
-                if command:
-                    self.voice_command_queue.put(command.lower())
+                if stop_event.is_set():
+                    break  # Stopped while listening - drop the clip
+                
+                # Don't spend a recognition request when there's no drone to command
+                if not self.voice_when_disconnected and not self.agent.is_connected:
+                    continue
+                
+                # Recognize off this thread so the next listen() starts right away;
+                # when recognition falls behind, the oldest clip is dropped
+                if len(self._pending_audio) == self._pending_audio.maxlen:
+                    self._dropped_audio += 1
+                    self.root.after_idle(self._show_dropped_audio)
+                self._pending_audio.append(audio)
+                recog_pool.submit(self._drain_recog)
                     
             except sr.WaitTimeoutError:
                 pass  # Normal timeout, continue listening
-            except sr.UnknownValueError:
-                pass  # Could not understand audio
-            except sr.RequestError as e:
-                self.log(f"❌ Voice recognition error: {e}")
-                time.sleep(1)
             except Exception as e:
                 self.log(f"❌ Voice error: {e}")
                 break
     
+    def _drain_recog(self):
+        """Recognize the oldest pending clip - one call per clip submitted."""
+        try:
+            audio = self._pending_audio.popleft()
+        except IndexError:
+            return  # Clip was dropped while this task waited
+        self._recognize_and_enqueue(audio)
+    
+    def _show_dropped_audio(self):
+        """Report skipped voice clips in the status label."""
+        if self.voice_enabled:
+            self.voice_status_label.config(
+                text=f"Voice: Listening... ({self._dropped_audio} skipped)", fg='#FF9800')
+    
+    def _recognize_and_enqueue(self, audio):
+        """Run speech recognition on captured audio and queue the resulting command."""
+        try:
+            command = self.recognizer.recognize_google(audio)
+            self._voice_backoff = 0.0
+            if command:
+                # Normalize once here; process_voice_command relies on it
+                self.voice_command_queue.put(command.strip().lower())
+                self.root.event_generate('<<VoiceCommand>>', when='tail')
+        except sr.UnknownValueError:
+            pass  # Could not understand audio
+        except sr.RequestError as e:
+            self._voice_backoff = min(max(self._voice_backoff * 2, 1.0), VOICE_MAX_BACKOFF)
+            self.log(f"❌ Voice recognition error: {e} (retrying in {self._voice_backoff:.0f}s)")
+        except Exception as e:
+            self.log(f"❌ Voice recognition error: {e}")
+    
+    def _drain_voice_queue(self):
+        """Process every queued voice command - bound to the <<VoiceCommand>> event."""
+        try:
+            while True:
+                self.process_voice_command(self.voice_command_queue.get_nowait())
+        except queue.Empty:
+            pass
+    
     def process_voice_command(self, command):
-        """Process a recognized voice command."""
+        """Process a recognized voice command (already stripped and lowercased)."""
         try:
-            command = command.strip().lower()
             self.log(f"🎤 Heard: '{command}'")
             
-            # SECURITY: Block dangerous commands from voice input
-            dangerous_commands = ['emergency', 'emergency stop']
-            if any(danger in command for danger in dangerous_commands):
-                self.log("🚫 SECURITY: Emergency commands blocked from voice input!")
-                self.log("   Use emergency button if needed.")
+            # SECURITY: Block dangerous commands from voice input - every blocked
+            # phrase ('emergency', 'emergency stop') contains 'emergency'
+            if 'emergency' in command:
+                self.log_many([
+                    "🚫 SECURITY: Emergency commands blocked from voice input!",
+                    "   Use emergency button if needed.",
+                ])
                 return
             
-            # Map common voice phrases to GUI actions
-            voice_mappings = {
-                'take off': self.takeoff,
-                'takeoff': self.takeoff,
-                'land': self.land,
-                'take a photo': self.take_photo,
-                'take photo': self.take_photo,
-                'start video': self.start_video,
-                'stop video': self.stop_video,
-                'connect': self.connect,
-                'disconnect': self.disconnect,
-                'enable face detection': lambda: self.toggle_detection('face'),
-                'start following': self.toggle_follow,
-                'stop following': self.toggle_follow,
-                'record video': self.toggle_recording,
-                'stop recording': self.toggle_recording,
-                # Vision analysis commands
-                'describe what you see': lambda: threading.Thread(target=self.analyze_current_view, daemon=True).start(),
-                'what do you see': lambda: threading.Thread(target=self.analyze_current_view, daemon=True).start(),
-                'describe what you see in the video': lambda: threading.Thread(target=self.analyze_current_view, daemon=True).start(),
-                'what do you see in the video': lambda: threading.Thread(target=self.analyze_current_view, daemon=True).start(),
-                'analyze view': lambda: threading.Thread(target=self.analyze_current_view, daemon=True).start(),
-                'analyze current view': lambda: threading.Thread(target=self.analyze_current_view, daemon=True).start(),
-                'describe the video': lambda: threading.Thread(target=self.analyze_current_view, daemon=True).start(),
-                'analyze the video': lambda: threading.Thread(target=self.analyze_current_view, daemon=True).start(),
-            }
-            
             # Check for direct command mappings
-            if command in voice_mappings:
-                action = voice_mappings[command]
+            action = self._voice_actions.get(command)
+            if action:
                 self.log(f"🎤 → Executing: {command}")
                 action()
                 return
             
-            # Try to parse movement commands
-            if self.parse_movement_command(command):
-                return
-            
-            # Try to parse rotation commands  
-            if self.parse_rotation_command(command):
+            # Try to parse movement and rotation commands
+            if self.parse_motion_command(command):
                 return
             
             # Try to parse vision commands
@@ -2600,63 +3604,76 @@ class DroneControlGUI:
             
             # Fallback to natural language processing
             self.log(f"🎤 → Natural language: {command}")
-            self.execute_command(command, "voice")
+            self._execute_normalized_command(command, "voice")
             
         except Exception as e:
             self.log(f"❌ Error processing voice command: {e}")
     
-    def parse_movement_command(self, command):
-        """Parse movement commands from voice input."""
-        movement_patterns = {
-            'move forward': 'forward',
-            'fly forward': 'forward',
-            'go forward': 'forward',
-            'move back': 'back',
-            'fly back': 'back',
-            'go back': 'back',
-            'move left': 'left',
-            'fly left': 'left',
-            'go left': 'left',
-            'move right': 'right',
-            'fly right': 'right',
-            'go right': 'right',
-            'move up': 'up',
-            'fly up': 'up',
-            'go up': 'up',
-            'move down': 'down',
-            'fly down': 'down',
-            'go down': 'down',
+    def _bg_analyze(self):
+        """Run analyze_current_view on the vision pool."""
+        self._vision_pool.submit(self.analyze_current_view)
+    
+    def _build_voice_actions(self):
+        """Build the exact-phrase voice command table once."""
+        # Map common voice phrases to GUI actions
+        self._voice_actions = {
+            'take off': self.takeoff,
+            'takeoff': self.takeoff,
+            'land': self.land,
+            'take a photo': self.take_photo,
+            'take photo': self.take_photo,
+            'start video': self.start_video,
+            'stop video': self.stop_video,
+            'connect': self.connect,
+            'disconnect': self.disconnect,
+            'enable face detection': lambda: self.toggle_detection('face'),
+            'start following': self.toggle_follow,
+            'stop following': self.toggle_follow,
+            'record video': self.toggle_recording,
+            'stop recording': self.toggle_recording,
+            # Vision analysis commands
+            'describe what you see': self._bg_analyze,
+            'what do you see': self._bg_analyze,
+            'describe what you see in the video': self._bg_analyze,
+            'what do you see in the video': self._bg_analyze,
+            'analyze view': self._bg_analyze,
+            'analyze current view': self._bg_analyze,
+            'describe the video': self._bg_analyze,
+            'analyze the video': self._bg_analyze,
         }
-        
-        for pattern, direction in movement_patterns.items():
-            if pattern in command:
-                self.log(f"🎤 → Moving {direction}")
-                self.move(direction)
-                return True
-        
-        return False
     
-    def parse_rotation_command(self, command):
-        """Parse rotation commands from voice input."""
-        rotation_patterns = {
-            'turn left': 'left',
-            'rotate left': 'left',
-            'spin left': 'left',
-            'turn right': 'right',
-            'rotate right': 'right',
-            'spin right': 'right',
-        }
-        
-        for pattern, direction in rotation_patterns.items():
-            if pattern in command:
-                self.log(f"🎤 → Rotating {direction}")
-                self.rotate(direction)
-                return True
+    def parse_motion_command(self, command):
+        """Parse movement and rotation commands from voice input."""
+        match = VOICE_MOTION_PATTERN.search(command)
+        if not match:
+            return False
         
-        return False
+        direction = match.group(match.lastgroup)
+        if match.lastgroup == 'move':
+            self.log(f"🎤 → Moving {direction}")
+            self.move(direction)
+        else:
+            self.log(f"🎤 → Rotating {direction}")
+            self.rotate(direction)
+        return True
+    
+    def _get_azure_client(self, endpoint, api_key, api_version):
+        """Return an AzureOpenAI client for these settings, reusing the last one if unchanged."""
+        key = (endpoint, api_key, api_version)
+        with self._azure_client_lock:
+            client = self._azure_client_cache.get(key)
+            if client is None:
+                client = _load_azure_openai()(
+                    azure_endpoint=endpoint,
+                    api_key=api_key,
+                    api_version=api_version
+                )
+                # Only the current settings are worth keeping warm
+                self._azure_client_cache = {key: client}
+            return client
     
     def setup_azure_openai(self):
-        """Initialize Azure OpenAI system."""
+        """Initialize Azure OpenAI system - the client is built on a worker thread."""
         try:
             # Try to load from environment variables first
             endpoint = os.getenv('AZURE_OPENAI_ENDPOINT')
@@ -2665,37 +3682,12 @@ class DroneControlGUI:
             
             if endpoint and api_key and deployment:
                 self.log("🤖 Loading Azure OpenAI configuration from environment...")
-                
-                # Update azure_settings
-                self.azure_settings.update({
-                    'endpoint': endpoint,
-                    'deployment': deployment,
-                    'api_key': api_key,
-                    'api_version': '2024-08-01-preview'
-                })
-                
-                # Initialize Azure OpenAI client
-                self.azure_openai_client = AzureOpenAI(
-                    azure_endpoint=endpoint,
-                    api_key=api_key,
-                    api_version='2024-08-01-preview'
-                )
-                
-                self.ai_enabled = True
-                self.log("✅ Azure OpenAI connected and ready!")
-                self.log("🤖 Natural language commands now available!")
-                
-                # Update AI indicator if it exists
-                if hasattr(self, 'ai_indicator'):
-                    self.ai_indicator.config(
-                        text="🤖 AI Status: Connected & Ready",
-                        fg='#4CAF50'
-                    )
+                self._cmd_pool.submit(self._bg_setup_azure, endpoint, api_key, deployment)
             else:
                 self.log("⚙️ Azure OpenAI integration ready - configure in Settings")
                 
                 # Update AI indicator if it exists
-                if hasattr(self, 'ai_indicator'):
+                if self.ai_indicator is not None:
                     self.ai_indicator.config(
                         text="🤖 AI Status: Click Settings to Configure",
                         fg='#FF9800'
@@ -2704,9 +3696,42 @@ class DroneControlGUI:
             self.log(f"⚠️ Azure OpenAI setup error: {e}")
             self.ai_enabled = False
     
+    def _bg_setup_azure(self, endpoint, api_key, deployment):
+        """Build the Azure OpenAI client off the Tk thread and hand it back via after()."""
+        try:
+            client = self._get_azure_client(endpoint, api_key, '2024-08-01-preview')
+            self.root.after(0, self._on_azure_ready, client, endpoint, api_key, deployment)
+        except Exception as e:
+            self.log(f"⚠️ Azure OpenAI setup error: {e}")
+            self.ai_enabled = False
+    
+    def _on_azure_ready(self, client, endpoint, api_key, deployment):
+        """Install a freshly built Azure OpenAI client (runs on the Tk thread)."""
+        # Update azure_settings
+        self.azure_settings.update({
+            'endpoint': endpoint,
+            'deployment': deployment,
+            'api_key': api_key,
+            'api_version': '2024-08-01-preview'
+        })
+        
+        self.azure_openai_client = client
+        self.ai_enabled = True
+        self.log_many([
+            "✅ Azure OpenAI connected and ready!",
+            "🤖 Natural language commands now available!",
+        ])
+        
+        # Update AI indicator if it exists
+        if self.ai_indicator is not None:
+            self.ai_indicator.config(
+                text="🤖 AI Status: Connected & Ready",
+                fg='#4CAF50'
+            )
+    
     def open_settings(self):
         """Open the settings configuration window."""
-        if hasattr(self, 'settings_window') and self.settings_window.winfo_exists():
+        if self.settings_window is not None and self.settings_window.winfo_exists():
             self.settings_window.lift()
             return
             
@@ -2746,86 +3771,14 @@ class DroneControlGUI:
         settings_frame = tk.Frame(main_frame, bg='#2b2b2b')
         settings_frame.pack(fill='x', pady=10)
         
-        # Azure Endpoint
-        tk.Label(
-            settings_frame,
-            text="Azure Endpoint URL:",
-            font=('Arial', 11, 'bold'),
-            fg='white',
-            bg='#2b2b2b'
-        ).pack(anchor='w', pady=(10, 2))
-        
-        self.endpoint_entry = tk.Entry(
-            settings_frame,
-            font=('Arial', 10),
-            bg='#404040',
-            fg='white',
-            insertbackground='white',
-            width=60
-        )
-        self.endpoint_entry.pack(fill='x', pady=(0, 5))
-        self.endpoint_entry.insert(0, self.azure_settings['endpoint'])
-        
-        # Deployment Name
-        tk.Label(
-            settings_frame,
-            text="Deployment Name:",
-            font=('Arial', 11, 'bold'),
-            fg='white',
-            bg='#2b2b2b'
-        ).pack(anchor='w', pady=(10, 2))
-        
-        self.deployment_entry = tk.Entry(
-            settings_frame,
-            font=('Arial', 10),
-            bg='#404040',
-            fg='white',
-            insertbackground='white',
-            width=60
-        )
-        self.deployment_entry.pack(fill='x', pady=(0, 5))
-        self.deployment_entry.insert(0, self.azure_settings['deployment'])
-        
-        # API Key
-        tk.Label(
-            settings_frame,
-            text="API Key:",
-            font=('Arial', 11, 'bold'),
-            fg='white',
-            bg='#2b2b2b'
-        ).pack(anchor='w', pady=(10, 2))
-        
-        self.api_key_entry = tk.Entry(
-            settings_frame,
-            font=('Arial', 10),
-            bg='#404040',
-            fg='white',
-            insertbackground='white',
-            width=60,
-            show='*'
-        )
-        self.api_key_entry.pack(fill='x', pady=(0, 5))
-        self.api_key_entry.insert(0, self.azure_settings['api_key'])
-        
-        # API Version
-        tk.Label(
-            settings_frame,
-            text="API Version:",
-            font=('Arial', 11, 'bold'),
-            fg='white',
-            bg='#2b2b2b'
-        ).pack(anchor='w', pady=(10, 2))
-        
-        self.api_version_entry = tk.Entry(
-            settings_frame,
-            font=('Arial', 10),
-            bg='#404040',
-            fg='white',
-            insertbackground='white',
-            width=60
-        )
-        self.api_version_entry.pack(fill='x', pady=(0, 5))
-        self.api_version_entry.insert(0, self.azure_settings['api_version'])
+        self.endpoint_entry = self._make_labeled_entry(
+            settings_frame, "Azure Endpoint URL:", self.azure_settings['endpoint'])
+        self.deployment_entry = self._make_labeled_entry(
+            settings_frame, "Deployment Name:", self.azure_settings['deployment'])
+        self.api_key_entry = self._make_labeled_entry(
+            settings_frame, "API Key:", self.azure_settings['api_key'], show='*')
+        self.api_version_entry = self._make_labeled_entry(
+            settings_frame, "API Version:", self.azure_settings['api_version'])
         
         # AI Status
         status_frame = tk.Frame(main_frame, bg='#2b2b2b')
@@ -2845,7 +3798,7 @@ class DroneControlGUI:
         button_frame.pack(fill='x', pady=20)
         
         # Test Connection Button
-        test_btn = tk.Button(
+        self.azure_test_btn = tk.Button(
             button_frame,
             text="🧪 Test Connection",
             font=('Arial', 10, 'bold'),
@@ -2854,7 +3807,7 @@ class DroneControlGUI:
             width=15,
             command=self.test_azure_connection
         )
-        test_btn.pack(side='left', padx=5)
+        self.azure_test_btn.pack(side='left', padx=5)
         
         # Save Button
         save_btn = tk.Button(
@@ -2881,41 +3834,52 @@ class DroneControlGUI:
         cancel_btn.pack(side='right', padx=5)
     
     def test_azure_connection(self):
-        """Test Azure OpenAI connection with current settings."""
-        try:
-            # Get current values from entries
-            endpoint = self.endpoint_entry.get().strip()
-            deployment = self.deployment_entry.get().strip()
-            api_key = self.api_key_entry.get().strip()
-            api_version = self.api_version_entry.get().strip()
-            
-            if not all([endpoint, deployment, api_key]):
-                messagebox.showerror("Error", "Please fill in all required fields")
-                return
-            
-            # Test connection
-            test_client = AzureOpenAI(
-                azure_endpoint=endpoint,
-                api_key=api_key,
-                api_version=api_version
-            )
-            
-            # Simple test call
-            response = test_client.chat.completions.create(
-                model=deployment,
-                messages=[{"role": "user", "content": "Hello, respond with 'test successful'"}],
-                max_tokens=10
-            )
-            
-            if response.choices[0].message.content:
-                messagebox.showinfo("Success", "✅ Azure OpenAI connection successful!")
-                self.ai_status_label.config(text="AI Status: ✅ Connected", fg='#4CAF50')
-            else:
-                messagebox.showerror("Error", "❌ Connection test failed - no response")
+        """Test Azure OpenAI connection with current settings."""
+        # Get current values from entries
+        endpoint = self.endpoint_entry.get().strip()
+        deployment = self.deployment_entry.get().strip()
+        api_key = self.api_key_entry.get().strip()
+        api_version = self.api_version_entry.get().strip()
+        
+        if not all([endpoint, deployment, api_key]):
+            messagebox.showerror("Error", "Please fill in all required fields")
+            return
+        
+        # The test request can take seconds, so run it off the Tk thread
+        self.azure_test_btn.config(state='disabled', text="⏳ Testing...")
+        
+        def test_thread():
+            try:
+                test_client = self._get_azure_client(endpoint, api_key, api_version)
                 
-        except Exception as e:
-            messagebox.showerror("Connection Error", f"❌ Failed to connect to Azure OpenAI:\n\n{str(e)}")
-            self.ai_status_label.config(text="AI Status: ❌ Connection Failed", fg='#f44336')
+                # Simple test call
+                response = test_client.chat.completions.create(
+                    model=deployment,
+                    messages=[{"role": "user", "content": "Hello, respond with 'test successful'"}],
+                    max_tokens=10
+                )
+                self.root.after(0, self._on_azure_test_result, bool(response.choices[0].message.content), None)
+            except Exception as e:
+                self.root.after(0, self._on_azure_test_result, False, str(e))
+        
+        self._cmd_pool.submit(test_thread)
+    
+    def _on_azure_test_result(self, success, error):
+        """Report an Azure OpenAI connection test result (runs on the Tk thread)."""
+        settings_open = self.settings_window.winfo_exists()
+        if settings_open:
+            self.azure_test_btn.config(state='normal', text="🧪 Test Connection")
+        
+        if success:
+            messagebox.showinfo("Success", "✅ Azure OpenAI connection successful!")
+            if settings_open:
+                self.ai_status_label.config(text="AI Status: ✅ Connected", fg='#4CAF50')
+        elif error is None:
+            messagebox.showerror("Error", "❌ Connection test failed - no response")
+        else:
+            messagebox.showerror("Connection Error", f"❌ Failed to connect to Azure OpenAI:\n\n{error}")
+            if settings_open:
+                self.ai_status_label.config(text="AI Status: ❌ Connection Failed", fg='#f44336')
     
     def save_azure_settings(self):
         """Save Azure OpenAI settings."""
@@ -2939,17 +3903,13 @@ class DroneControlGUI:
             })
             
             # Initialize Azure OpenAI client
-            self.azure_openai_client = AzureOpenAI(
-                azure_endpoint=endpoint,
-                api_key=api_key,
-                api_version=api_version
-            )
+            self.azure_openai_client = self._get_azure_client(endpoint, api_key, api_version)
             
             self.ai_enabled = True
             self.ai_status_label.config(text="AI Status: ✅ Enabled", fg='#4CAF50')
             
             # Update main AI indicator
-            if hasattr(self, 'ai_indicator'):
+            if self.ai_indicator is not None:
                 self.ai_indicator.config(
                     text="🤖 AI Status: Connected & Ready",
                     fg='#4CAF50'
@@ -2959,8 +3919,10 @@ class DroneControlGUI:
             self.settings_window.destroy()
             
             # Log success
-            self.log("✅ Azure OpenAI settings saved and enabled!")
-            self.log("🤖 Natural language commands now powered by AI")
+            self.log_many([
+                "✅ Azure OpenAI settings saved and enabled!",
+                "🤖 Natural language commands now powered by AI",
+            ])
             
             messagebox.showinfo("Settings Saved", "✅ Azure OpenAI configured successfully!\n\nYou can now use advanced natural language commands.")
             
@@ -2969,71 +3931,40 @@ class DroneControlGUI:
     
     def process_with_azure_openai(self, user_input):
         """Process user input through Azure OpenAI to generate drone commands."""
+        # Simple single-verb requests don't need the model
+        commands = _match_local_ai_command(user_input)
+        if commands:
+            self.log(f"⚡ Interpreted locally: '{user_input}' → {', '.join(c['action'] for c in commands)}")
+            return commands
+        
         if not self.ai_enabled or not self.azure_openai_client:
             self.log("❌ Azure OpenAI not configured - using basic command parsing")
             return None
         
+        # Repeated utterances ("take a photo", "land") skip the round-trip
+        cache_key = (self.azure_settings['deployment'], _normalize_ai_input(user_input))
+        with self._ai_command_cache_lock:
+            cached = self._ai_command_cache.get(cache_key)
+            if cached is not None:
+                self._ai_command_cache.move_to_end(cache_key)
+        if cached is not None:
+            commands = json.loads(cached)  # Fresh copy - callers may mutate parameters
+            self.log(f"🤖 AI interpreted (cached): '{user_input}' → {len(commands)} commands")
+            return commands
+        
         try:
             # the newest OpenAI model is "gpt-5" which was released August 7, 2025.
             # do not change this unless explicitly requested by the user
-            system_prompt = """You are an intelligent drone command interpreter. Convert natural language instructions into specific drone commands.
-
-Available drone commands:
-- takeoff: Make the drone take off
-- land: Make the drone land
-- move_forward(distance): Move forward in cm (20-500)
-- move_back(distance): Move backward in cm (20-500)  
-- move_left(distance): Move left in cm (20-500)
-- move_right(distance): Move right in cm (20-500)
-- move_up(distance): Move up in cm (20-500)
-- move_down(distance): Move down in cm (20-500)
-- rotate_clockwise(degrees): Rotate clockwise (1-360)
-- rotate_counter_clockwise(degrees): Rotate counter-clockwise (1-360)
-- hover(seconds): Hover in place for specified seconds
-- take_photo(): Take a single photo
-- take_photo_burst(count): Take multiple photos
-- analyze_view(prompt, use_photo): Analyze current view or saved photo with custom prompt
-- start_video_recording(): Start recording video
-- stop_video_recording(): Stop recording video
-- enable_detection(type): Enable object detection (face, person, vehicle)
-- disable_detection(): Disable object detection
-- start_follow_mode(type): Start following detected objects
-- stop_follow_mode(): Stop following objects
-
-CRITICAL: You MUST respond with a JSON object containing a "commands" array. Even for single commands, wrap them in an array.
-
-Required format: {"commands": [{"action": "command_name", "parameters": {...}}]}
-
-IMPORTANT: For analyze_view commands, generate SPECIFIC prompts based on user intent:
-- If user says "describe" → prompt focuses on scene/atmosphere description
-- If user says "identify objects" → prompt focuses on object identification and listing
-- If user says "identify [specific thing]" → prompt focuses on that specific thing
-- If user mentions "picture" or "photo" → set use_photo: true
-- If user says "now", "current view", "currently" → set use_photo: false
-
-Examples:
-- "land safely" → {"commands": [{"action": "land", "parameters": {}}]}
-- "fly forward 2 meters" → {"commands": [{"action": "move_forward", "parameters": {"distance": 200}}]}
-- "turn left 90 degrees then move right" → {"commands": [{"action": "rotate_counter_clockwise", "parameters": {"degrees": 90}}, {"action": "move_right", "parameters": {"distance": 100}}]}
-- "take off and hover for 5 seconds" → {"commands": [{"action": "takeoff", "parameters": {}}, {"action": "hover", "parameters": {"seconds": 5}}]}
-- "take a photo and describe it" → {"commands": [{"action": "take_photo", "parameters": {}}, {"action": "analyze_view", "parameters": {"prompt": "describe the overall scene, colors, and atmosphere in this photo", "use_photo": true}}]}
-- "take a picture and identify objects" → {"commands": [{"action": "take_photo", "parameters": {}}, {"action": "analyze_view", "parameters": {"prompt": "identify and list all objects visible in this photo", "use_photo": true}}]}
-- "take picture and identify objects in the picture" → {"commands": [{"action": "take_photo", "parameters": {}}, {"action": "analyze_view", "parameters": {"prompt": "identify and list all objects visible in this photo", "use_photo": true}}]}
-- "take photo then identify cars" → {"commands": [{"action": "take_photo", "parameters": {}}, {"action": "analyze_view", "parameters": {"prompt": "count and describe all cars visible in this photo", "use_photo": true}}]}
-- "take photo and look for people" → {"commands": [{"action": "take_photo", "parameters": {}}, {"action": "analyze_view", "parameters": {"prompt": "identify and count people in this photo", "use_photo": true}}]}
-- "describe what you see now" → {"commands": [{"action": "analyze_view", "parameters": {"prompt": "describe the current live view from the drone camera", "use_photo": false}}]}
-- "what objects are visible right now" → {"commands": [{"action": "analyze_view", "parameters": {"prompt": "identify objects currently visible in the live camera feed", "use_photo": false}}]}
-- "count buildings in current view" → {"commands": [{"action": "analyze_view", "parameters": {"prompt": "count and describe buildings visible in the current view", "use_photo": false}}]}"""
-
             response = self.azure_openai_client.chat.completions.create(
                 model=self.azure_settings['deployment'],
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": AZURE_COMMAND_SYSTEM_PROMPT},
                     {"role": "user", "content": user_input}
                 ],
                 response_format={"type": "json_object"},
                 max_tokens=1000
             )
+            self._log_prompt_cache_hit(response)
             
             # Parse response
             ai_response = response.choices[0].message.content
@@ -3051,6 +3982,10 @@ Examples:
             
             if commands:
                 self.log(f"🤖 AI interpreted: '{user_input}' → {len(commands)} commands")
+                with self._ai_command_cache_lock:
+                    self._ai_command_cache[cache_key] = json.dumps(commands)
+                    if len(self._ai_command_cache) > AI_COMMAND_CACHE_SIZE:
+                        self._ai_command_cache.popitem(last=False)
             else:
                 self.log(f"🤖 AI could not interpret: '{user_input}'")
             return commands
@@ -3059,8 +3994,24 @@ Examples:
             self.log(f"❌ Azure OpenAI processing error: {e}")
             return None
     
-    def analyze_image_with_ai(self, image_data, prompt="Describe what you see in this image in 2-3 sentences."):
-        """Analyze an image using Azure OpenAI Vision API."""
+    def _log_prompt_cache_hit(self, response):
+        """Log how many prompt tokens the service served from its prefix cache."""
+        usage = getattr(response, 'usage', None)
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cached = getattr(details, 'cached_tokens', None)
+        if cached:
+            self.log(f"⚡ Prompt cache hit: {cached}/{usage.prompt_tokens} tokens")
+    
+    def analyze_image_with_ai(self, image_data, prompt="Describe what you see in this image in 2-3 sentences.",
+                              speak_prefix=None, detail=None):
+        """
+        Analyze an image using Azure OpenAI Vision API.
+        
+        If speak_prefix is given the response is streamed and each sentence is
+        spoken as soon as it arrives, the first one prefixed with speak_prefix.
+        detail is the image detail level ('low'/'high'); by default it is
+        picked from the prompt's keywords.
+        """
         if not self.ai_enabled or not self.azure_openai_client:
             self.log("❌ Azure OpenAI not configured for vision analysis")
             return None
@@ -3071,52 +4022,57 @@ Examples:
                 self.log("❌ No image data provided for analysis")
                 return None
             
-            self.log(f"🔍 Image data type: {type(image_data)}")
+            if self.vision_debug:
+                self.log(f"🔍 Image data type: {type(image_data)}")
             
-            # Convert image to base64
+            # Encode to JPEG - numpy frames go straight through OpenCV, other inputs via PIL
             if isinstance(image_data, np.ndarray):
-                self.log(f"🔍 NumPy array shape: {image_data.shape}")
-                # Convert OpenCV/numpy array to PIL Image
-                if len(image_data.shape) == 3 and image_data.shape[2] == 3:
-                    # Convert BGR to RGB for PIL
-                    image_data = cv2.cvtColor(image_data, cv2.COLOR_BGR2RGB)
-                elif len(image_data.shape) == 3 and image_data.shape[2] == 4:
-                    # Handle RGBA format
-                    image_data = cv2.cvtColor(image_data, cv2.COLOR_BGRA2RGB)
-                image = Image.fromarray(image_data)
-            elif isinstance(image_data, Image.Image):
-                image = image_data
-            elif hasattr(image_data, '_PhotoImage__photo'):
-                # Handle PIL.ImageTk.PhotoImage (Tkinter format)
-                self.log("🔄 Converting PhotoImage to PIL Image...")
-                # PhotoImage stores the underlying PIL image in _PhotoImage__photo
-                try:
-                    # Try to get the original PIL image if available
-                    if hasattr(image_data, '_PhotoImage__photo') and hasattr(image_data._PhotoImage__photo, 'copy'):
-                        image = image_data._PhotoImage__photo.copy()
-                    else:
-                        # Fallback: convert via tk's internal methods
-                        self.log("❌ Cannot convert PhotoImage - no source PIL image available")
-                        return None
-                except Exception as e:
-                    self.log(f"❌ PhotoImage conversion error: {e}")
+                if self.vision_debug:
+                    self.log(f"🔍 NumPy array shape: {image_data.shape}")
+                if len(image_data.shape) == 3 and image_data.shape[2] == 4:
+                    # Drop the alpha channel - JPEG has none; BGR order is what imencode wants
+                    image_data = np.ascontiguousarray(image_data[..., :3])
+                # Downscale to what the model actually looks at
+                height, width = image_data.shape[:2]
+                scale = VISION_MAX_SIDE / max(height, width)
+                if scale < 1:
+                    image_data = cv2.resize(image_data, (int(width * scale), int(height * scale)),
+                                            interpolation=cv2.INTER_AREA)
+                ok, encoded = cv2.imencode('.jpg', image_data,
+                                           [int(cv2.IMWRITE_JPEG_QUALITY), VISION_JPEG_QUALITY])
+                if not ok:
+                    self.log("❌ Failed to encode frame for vision analysis")
                     return None
+                jpeg_bytes = encoded  # uint8 buffer - base64 reads it without a copy
             else:
-                self.log(f"❌ Unsupported image format for vision analysis: {type(image_data)}")
-                return None
+                if not isinstance(image_data, Image.Image):
+                    self.log(f"❌ Unsupported image format for vision analysis: {type(image_data)}")
+                    return None
+                image = image_data
+                
+                # Downscale to what the model actually looks at (copy - don't shrink the caller's image)
+                if max(image.size) > VISION_MAX_SIDE:
+                    image = image.copy()
+                    image.thumbnail((VISION_MAX_SIDE, VISION_MAX_SIDE), Image.BILINEAR)
+                
+                buffered = io.BytesIO()
+                image.save(buffered, format="JPEG", quality=VISION_JPEG_QUALITY,
+                           optimize=False, progressive=False)
+                jpeg_bytes = buffered.getbuffer()  # View, not a copy of the buffer
+            
+            img_base64 = base64.b64encode(jpeg_bytes).decode('ascii')
             
-            # Convert to base64
-            buffered = io.BytesIO()
-            image.save(buffered, format="JPEG", quality=85)
-            img_base64 = base64.b64encode(buffered.getvalue()).decode('utf-8')
+            if detail is None:
+                detail = self._vision_detail(prompt)
             
             # Create vision request
+            stream = speak_prefix is not None
             response = self.azure_openai_client.chat.completions.create(
                 model=self.azure_settings['deployment'],
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a drone vision assistant. Analyze images from a drone's perspective and provide clear, concise descriptions. Always limit your response to 2-3 sentences maximum."
+                        "content": AZURE_VISION_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -3126,22 +4082,64 @@ Examples:
                                 "type": "image_url",
                                 "image_url": {
                                     "url": f"data:image/jpeg;base64,{img_base64}",
-                                    "detail": "high"
+                                    "detail": detail
                                 }
                             }
                         ]
                     }
                 ],
-                max_tokens=200
+                max_tokens=VISION_MAX_TOKENS,
+                stream=stream,
+                timeout=VISION_REQUEST_TIMEOUT
             )
             
-            description = response.choices[0].message.content
-            return description
+            if not stream:
+                return response.choices[0].message.content
+            
+            # Speak complete sentences while the rest is still being generated -
+            # all of them as one streamed utterance, opened at the first sentence
+            parts = []
+            pending = speak_prefix
+            speech = None
+            try:
+                for chunk in response:
+                    if not chunk.choices:
+                        continue  # Azure sends content-filter results in choice-less chunks
+                    text = chunk.choices[0].delta.content
+                    if not text:
+                        continue
+                    parts.append(text)
+                    pending += text
+                    boundary = None
+                    for match in VISION_SENTENCE_END.finditer(pending):
+                        boundary = match.end()
+                    if boundary:
+                        if speech is None:
+                            speech = self.open_speech_stream()
+                        if speech is not None:
+                            speech.put(pending[:boundary])
+                        pending = pending[boundary:]
+                if parts and pending.strip():
+                    if speech is None:
+                        speech = self.open_speech_stream()
+                    if speech is not None:
+                        speech.put(pending)
+            finally:
+                if speech is not None:
+                    speech.put(None)
+            return ''.join(parts) or None
             
         except Exception as e:
             self.log(f"❌ Vision analysis error: {e}")
             return None
     
+    @staticmethod
+    def _vision_detail(prompt):
+        """Image detail level for a prompt - 'high' only when it asks for fine detail."""
+        if not prompt:
+            return 'low'
+        return 'high' if VISION_HIGH_DETAIL_PATTERN.search(prompt.lower()) else 'low'
+    
     def analyze_current_view(self, custom_prompt=None, use_photo=False):
         """
         Analyze the current video frame or saved photo with custom prompt.
@@ -3152,14 +4150,9 @@ Examples:
         """
         # Determine image source based on use_photo parameter
         if use_photo:
-            # Find the most recent saved photo
-            import glob
-            import os
-            photo_files = glob.glob("tello_photo_*.jpg")
-            if photo_files:
-                # Sort by modification time to get the most recent
-                photo_files.sort(key=os.path.getmtime, reverse=True)
-                recent_photo = photo_files[0]
+            # Most recent photo saved by the agent this session
+            if self.agent.recent_photos:
+                recent_photo = self.agent.recent_photos[-1]
                 self.log(f"🔍 Using most recent saved photo: {recent_photo}")
                 return self.analyze_captured_photo(recent_photo, custom_prompt)
             else:
@@ -3172,36 +4165,37 @@ Examples:
             if hasattr(self.agent, 'current_frame') and self.agent.current_frame is not None:
                 frame_data = self.agent.current_frame
                 self.log("🔍 Using live camera feed from agent...")
-            elif self.video_frame is not None:
-                frame_data = self.video_frame
+            elif self._last_pil_frame is not None:
+                frame_data = self._last_pil_frame
                 self.log("🔍 Using GUI video frame...")
             else:
                 self.log("❌ No video frame available for analysis")
                 return None
             
             self.log("🔍 Analyzing current view...")
-            self.log(f"🔍 Frame data type: {type(frame_data)}")
-            if hasattr(frame_data, 'shape'):
-                self.log(f"🔍 Frame shape: {frame_data.shape}")
+            if self.vision_debug:
+                self.log(f"🔍 Frame data type: {type(frame_data)}")
+                if hasattr(frame_data, 'shape'):
+                    self.log(f"🔍 Frame shape: {frame_data.shape}")
             
             # Use custom prompt or default (always limit to 2-3 sentences)
             if custom_prompt:
                 prompt = f"{custom_prompt}. Keep your response to 2-3 sentences maximum."
-                self.log(f"🎯 DEBUG: Using custom prompt: '{custom_prompt}'")
+                if self.vision_debug:
+                    self.log(f"🎯 DEBUG: Using custom prompt: '{custom_prompt}'")
             else:
                 prompt = "In 2-3 sentences, identify the main objects and any actions you see from this drone's perspective."
-                self.log("🎯 DEBUG: Using default prompt (no custom prompt provided)")
+                if self.vision_debug:
+                    self.log("🎯 DEBUG: Using default prompt (no custom prompt provided)")
             
-            description = self.analyze_image_with_ai(frame_data, prompt)
+            # Only the user's own wording decides the detail level - the default prompt is a scene description
+            description = self.analyze_image_with_ai(frame_data, prompt, speak_prefix="Vision analysis: ",
+                                                     detail=self._vision_detail(custom_prompt))
             
             if description:
                 source_type = "Saved Photo" if use_photo else "Live Camera"
                 self.log(f"👁️ Vision Analysis ({source_type}): {description}")
-                self.update_vision_results(f"[{time.strftime('%H:%M:%S')}] {source_type} Analysis:\nPrompt: {prompt}\nResult: {description}\n\n")
-                
-                # Speak the analysis result
-                self.speak_text(f"Vision analysis: {description}")
-                
+                self.update_vision_results(f"[{self._clock_text()}] {source_type} Analysis:\nPrompt: {prompt}\nResult: {description}\n\n")
                 return description
         return None
     
@@ -3214,27 +4208,29 @@ Examples:
             custom_prompt: Custom analysis prompt from user's request
         """
         try:
-            # Load image
-            image = Image.open(image_path)
             self.log(f"🔍 Analyzing captured photo: {image_path}")
             
             # Use custom prompt or default (always limit to 2-3 sentences)
             if custom_prompt:
                 prompt = f"{custom_prompt}. Keep your response to 2-3 sentences maximum."
-                self.log(f"📸 DEBUG: Using custom prompt for photo: '{custom_prompt}'")
+                if self.vision_debug:
+                    self.log(f"📸 DEBUG: Using custom prompt for photo: '{custom_prompt}'")
             else:
                 prompt = "In 2-3 sentences, identify the main objects and any actions visible in this drone photo."
-                self.log("📸 DEBUG: Using default prompt for photo (no custom prompt provided)")
+                if self.vision_debug:
+                    self.log("📸 DEBUG: Using default prompt for photo (no custom prompt provided)")
             
-            description = self.analyze_image_with_ai(image, prompt)
+            # Read the photo here on the worker thread; draft() lets the JPEG
+            # decoder downscale while decoding, and the file is closed afterwards
+            with Image.open(image_path) as image:
+                image.draft('RGB', (VISION_MAX_SIDE, VISION_MAX_SIDE))
+                image.load()
+                description = self.analyze_image_with_ai(image, prompt, speak_prefix="Photo analysis: ",
+                                                         detail=self._vision_detail(custom_prompt))
             
             if description:
                 self.log(f"📸 Photo Analysis: {description}")
-                self.update_vision_results(f"[{time.strftime('%H:%M:%S')}] Photo Analysis ({image_path}):\nPrompt: {prompt}\nResult: {description}\n\n")
-                
-                # Speak the photo analysis result
-                self.speak_text(f"Photo analysis: {description}")
-                
+                self.update_vision_results(f"[{self._clock_text()}] Photo Analysis ({image_path}):\nPrompt: {prompt}\nResult: {description}\n\n")
                 return description
             return None
             
@@ -3244,22 +4240,17 @@ Examples:
     
     def thread_safe_vision_analysis(self, custom_prompt=None, use_photo=False):
         """
-        Thread-safe wrapper for vision analysis that marshals to main GUI thread.
-        This ensures Tkinter widgets are only updated from the main thread.
+        Vision analysis entry point for agent callbacks.
+        Runs on the vision pool so JPEG/base64 encoding and the API call never
+        block the Tk main loop; results reach widgets through root.after().
         """
-        # Marshal the call to the main thread using Tkinter's after() method
         def safe_analyze():
             try:
                 self.analyze_current_view(custom_prompt, use_photo)
             except Exception as e:
                 self.log(f"❌ Thread-safe vision analysis error: {e}")
         
-        # Schedule execution on main thread
-        if hasattr(self, 'root') and self.root:
-            self.root.after(0, safe_analyze)
-        else:
-            # Fallback: run directly if no root available (shouldn't happen in normal operation)
-            safe_analyze()
+        self._vision_pool.submit(safe_analyze)
     
     def update_vision_results(self, text):
         """Update the vision results panel with new analysis."""
@@ -3310,35 +4301,16 @@ Examples:
                     state='normal'
                 ))
         
-        threading.Thread(target=analysis_thread, daemon=True).start()
+        self._vision_pool.submit(analysis_thread)
     
     def setup_tts(self):
         """Initialize text-to-speech engine with dedicated worker thread."""
-        # Check if espeak is available (try espeak-ng first)
-        try:
-            import subprocess
-            # Try espeak-ng first
-            result = subprocess.run(['espeak-ng', '--version'], 
-                                  capture_output=True, timeout=5)
-            if result.returncode == 0:
-                self.log("✅ Espeak-ng TTS system detected and ready")
-                self.tts_enabled = True
-                self.tts_engine = "espeak-ng"  # Mark that we're using espeak-ng
-                return
-            
-            # Fallback to regular espeak
-            result = subprocess.run(['espeak', '--version'], 
-                                  capture_output=True, timeout=5)
-            if result.returncode == 0:
-                self.log("✅ Espeak TTS system detected and ready")
-                self.tts_enabled = True
-                self.tts_engine = "espeak"  # Mark that we're using espeak
-                return
-            else:
-                self.log("❌ Neither espeak nor espeak-ng available - checking fallback...")
-        except Exception:
-            # Silently handle espeak unavailability
-            pass
+        # Prefer command-line espeak when it's installed
+        if ESPEAK_COMMAND:
+            self.log(f"✅ {ESPEAK_COMMAND.capitalize()} TTS system detected and ready")
+            self.tts_enabled = True
+            self.tts_engine = ESPEAK_COMMAND  # Mark which espeak binary we're using
+            return
         
         # TTS setup with real-time option
         self.log(f"🔍 Audio capabilities: TTS={TTS_AVAILABLE}, SimpleAudio={SIMPLEAUDIO_AVAILABLE}, RealtimeAudio={REALTIME_AUDIO_AVAILABLE}")
@@ -3429,8 +4401,6 @@ Examples:
     
     def _is_cloud_environment(self):
         """Detect if running in cloud environment without audio."""
-        import os
-        
         # Check for Replit environment variables
         if os.getenv('REPLIT_DB_URL') or os.getenv('REPL_ID') or os.getenv('REPLIT_DEPLOYMENT'):
             self.log("🌥️ Detected Replit cloud environment")
@@ -3439,12 +4409,13 @@ Examples:
         return False  # Local environment
         
     def _check_local_audio_system(self):
-        """Check if local audio system is available and working."""
-        import os
-        import sys
-        import subprocess
-        import shutil
-        
+        """Check if local audio system is available and working (probed once)."""
+        if self._audio_system_available is None:
+            self._audio_system_available = self._probe_local_audio_system()
+        return self._audio_system_available
+    
+    def _probe_local_audio_system(self):
+        """Probe the platform audio stack - see _check_local_audio_system."""
         # Platform-specific audio checks
         if sys.platform.startswith('linux'):
             # Check for ALSA devices
@@ -3480,7 +4451,7 @@ Examples:
             except Exception:
                 self.log("⚠️ Could not check PulseAudio status")
                 
-        elif sys.platform.startswith('win'):
+        elif IS_WINDOWS:
             # Windows usually has audio available
             self.log("🔊 Windows audio system assumed available")
             return True
@@ -3513,21 +4484,66 @@ Examples:
         
         try:
             # Clean up text for better speech
-            speech_text = text.replace("[", "").replace("]", "").replace("*", "")
+            speech_text = self._clean_speech_text(text)
             self.log(f"🔊 Queuing TTS: {speech_text[:50]}{'...' if len(speech_text) > 50 else ''}")
-            
-            # Add to worker queue
-            self.tts_queue.put(speech_text)
+            self._enqueue_utterance(speech_text)
             
         except Exception as e:
             self.log(f"❌ Speech queue error: {e}")
     
+    def open_speech_stream(self):
+        """Queue one utterance whose sentences arrive while it is being generated.
+        
+        Returns a queue to put sentences on, closed by putting None, or None when TTS
+        is off. The whole stream is a single entry in the bounded TTS queue, so its
+        opening sentences are never dropped to make room for its later ones.
+        """
+        if not self.tts_enabled or not self.tts_queue:
+            return None
+        sentences = queue.SimpleQueue()
+        self.log("🔊 Queuing streamed TTS")
+        self._enqueue_utterance(sentences)
+        return sentences
+    
+    def _enqueue_utterance(self, utterance):
+        """Add a whole utterance to the TTS queue, dropping the oldest waiting one when full."""
+        while True:
+            try:
+                self.tts_queue.put_nowait(utterance)
+                break
+            except queue.Full:
+                try:
+                    self.tts_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    @staticmethod
+    def _clean_speech_text(text):
+        """Strip markup characters that TTS engines read out literally."""
+        return text.replace("[", "").replace("]", "").replace("*", "")
+    
+    def _speak_streamed_utterance(self, sentences):
+        """Speak a streamed utterance sentence by sentence until it is closed."""
+        while True:
+            try:
+                sentence = sentences.get(timeout=TTS_STREAM_TIMEOUT)
+            except queue.Empty:
+                self.log("⚠️ Streamed speech stalled - skipping the rest")
+                return
+            if sentence is None:
+                return
+            sentence = self._clean_speech_text(sentence)
+            self.log(f"🔊 Speaking: {sentence[:30]}{'...' if len(sentence) > 30 else ''}")
+            self._method3_audio_speak(sentence)
+    
     def start_tts_worker(self):
         """Start simple TTS worker thread using pyttsx3."""
         def simple_tts_worker():
             """Simple TTS worker - processes speech queue."""
             try:
                 self.log("🔊 Starting simple TTS worker...")
+                last_spoken = None
+                last_spoken_at = 0.0
                 
                 # Process speech queue
                 while True:
@@ -3538,6 +4554,17 @@ Examples:
                         if text == "STOP":  # Stop signal
                             break
                         
+                        if isinstance(text, queue.SimpleQueue):
+                            self._speak_streamed_utterance(text)
+                            continue
+                        
+                        # Coalesce back-to-back repeats of the same message
+                        now = time.monotonic()
+                        if text == last_spoken and now - last_spoken_at < TTS_REPEAT_WINDOW:
+                            continue
+                        last_spoken = text
+                        last_spoken_at = now
+                        
                         self.log(f"🔊 Speaking: {text[:30]}{'...' if len(text) > 30 else ''}")
                         
                         # Use Method 3 for audio generation and playback
@@ -3599,8 +4626,9 @@ Examples:
     def create_realtime_event_loop(self):
         """Create dedicated asyncio event loop for real-time processing."""
         try:
-            # Create new event loop for this thread
-            self.realtime_loop = asyncio.new_event_loop()
+            # Create new event loop for this thread - uvloop when installed; the
+            # Tk thread never runs asyncio, so only this loop is affected
+            self.realtime_loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
             asyncio.set_event_loop(self.realtime_loop)
             
             # Run the real-time session
@@ -3657,15 +4685,12 @@ Examples:
             self.advanced_functions = {
                 "curve_xyz_speed": self.curve_xyz_speed,
                 "go_xyz_speed": self.go_xyz_speed,
-                "precise_move_forward": self.precise_move_forward,
-                "precise_move_backward": self.precise_move_backward,
-                "precise_move_left": self.precise_move_left,
-                "precise_move_right": self.precise_move_right,
-                "precise_move_up": self.precise_move_up,
-                "precise_move_down": self.precise_move_down,
-                "precise_rotate_clockwise": self.precise_rotate_clockwise,
-                "precise_rotate_counter_clockwise": self.precise_rotate_counter_clockwise
+                "fly_path": self.fly_path,
             }
+            self.advanced_functions.update(
+                (name, functools.partial(self._precise, tello_cmd))
+                for name, tello_cmd in PRECISE_COMMANDS.items()
+            )
             
             self.log("✅ Advanced drone functions registered")
             
@@ -3677,14 +4702,15 @@ Examples:
         try:
             self.log(f"🌀 Curve flight: ({x1},{y1},{z1}) -> ({x2},{y2},{z2}) at {speed}cm/s")
             
-            # Validate waypoint distances (must be at least 20cm from origin)
-            dist1 = (x1**2 + y1**2 + z1**2)**0.5
-            dist2 = (x2**2 + y2**2 + z2**2)**0.5
+            # Validate waypoint distances (must be at least 20cm from origin) -
+            # compared squared, the root is only taken for the error message
+            dist1_sq = x1 * x1 + y1 * y1 + z1 * z1
+            dist2_sq = x2 * x2 + y2 * y2 + z2 * z2
             
-            if dist1 < 20:
-                return f"❌ First waypoint too close to origin: {dist1:.1f}cm (minimum 20cm)"
-            if dist2 < 20:
-                return f"❌ Second waypoint too close to origin: {dist2:.1f}cm (minimum 20cm)"
+            if dist1_sq < CURVE_MIN_WAYPOINT_CM * CURVE_MIN_WAYPOINT_CM:
+                return f"❌ First waypoint too close to origin: {dist1_sq ** 0.5:.1f}cm (minimum 20cm)"
+            if dist2_sq < CURVE_MIN_WAYPOINT_CM * CURVE_MIN_WAYPOINT_CM:
+                return f"❌ Second waypoint too close to origin: {dist2_sq ** 0.5:.1f}cm (minimum 20cm)"
             
             # Execute curve command
             result = self.agent.execute_command(f"curve {x1} {y1} {z1} {x2} {y2} {z2} {speed}")
@@ -3711,38 +4737,50 @@ Examples:
             self.log(f"❌ {error_msg}")
             return error_msg
     
-    # Precise movement functions with distance parameters
-    async def precise_move_forward(self, distance: int):
-        """Move forward with precise distance control (5-300cm)."""
-        return self.agent.execute_command(f"forward {distance}")
-    
-    async def precise_move_backward(self, distance: int):
-        """Move backward with precise distance control (5-100cm)."""
-        return self.agent.execute_command(f"back {distance}")
-    
-    async def precise_move_left(self, distance: int):
-        """Move left with precise distance control (5-100cm)."""
-        return self.agent.execute_command(f"left {distance}")
-    
-    async def precise_move_right(self, distance: int):
-        """Move right with precise distance control (5-100cm)."""
-        return self.agent.execute_command(f"right {distance}")
-    
-    async def precise_move_up(self, distance: int):
-        """Move up with precise distance control (20-100cm)."""
-        return self.agent.execute_command(f"up {distance}")
-    
-    async def precise_move_down(self, distance: int):
-        """Move down with precise distance control (20-100cm)."""
-        return self.agent.execute_command(f"down {distance}")
-    
-    async def precise_rotate_clockwise(self, angle: int):
-        """Rotate clockwise with precise angle control (30-180°)."""
-        return self.agent.execute_command(f"cw {angle}")
-    
-    async def precise_rotate_counter_clockwise(self, angle: int):
-        """Rotate counter-clockwise with precise angle control (30-180°)."""
-        return self.agent.execute_command(f"ccw {angle}")
+    async def _precise(self, tello_cmd, distance=None, angle=None):
+        """Send a single-value Tello command ("forward 50", "cw 90") - backs the precise_* functions.
+        
+        Moves take distance and rotations take angle, as the old per-command functions did.
+        """
+        value = distance if distance is not None else angle
+        return self.agent.execute_command(f"{tello_cmd} {value}")
+    
+    async def fly_path(self, steps: list):
+        """Fly a multi-step path in one call.
+        
+        Each step is {"action": <precise_* name or Tello command>, "value": <cm or degrees>},
+        e.g. [{"action": "takeoff"}, {"action": "precise_move_forward", "value": 100},
+        {"action": "land"}]. Every step is checked against FLY_PATH_RANGES before any is
+        sent, and the first bad one is reported with nothing queued; otherwise they are all
+        queued together - the agent's command worker runs them in order, each one waiting
+        for the drone to finish the previous.
+        """
+        commands = []
+        for i, step in enumerate(steps, 1):
+            if not isinstance(step, dict):
+                return f"❌ Path step {i} is not an object: {step!r}"
+            action = str(step.get("action", "")).strip()
+            tello_cmd = PRECISE_COMMANDS.get(action, action)
+            if tello_cmd not in FLY_PATH_RANGES:
+                return f"❌ Path step {i} has unknown action: {action!r}"
+            value = step.get("value")
+            value_range = FLY_PATH_RANGES[tello_cmd]
+            if value_range is None:
+                if value is not None:
+                    return f"❌ Path step {i}: {tello_cmd} takes no value"
+                commands.append(tello_cmd)
+                continue
+            if isinstance(value, bool) or not isinstance(value, int):
+                return f"❌ Path step {i}: {tello_cmd} needs a whole-number value, got {value!r}"
+            if not value_range[0] <= value <= value_range[1]:
+                return f"❌ Path step {i}: {tello_cmd} {value} is outside {value_range[0]}-{value_range[1]}"
+            commands.append(f"{tello_cmd} {value}")
+        
+        if not commands:
+            return "❌ Empty path"
+        
+        self.log(f"🧭 Flight path: {' → '.join(commands)}")
+        return "\n".join(self.agent.execute_command(cmd) for cmd in commands)
     
     def toggle_realtime_mode(self):
         """Toggle between chat mode and real-time speech mode."""
@@ -3813,35 +4851,34 @@ Examples:
     def _method3_audio_speak(self, text):
         """Method 3: TTS using audio file generation and playback."""
         try:
-            import tempfile
-            import os
-            import subprocess
-            
             self.log("🔊 Generating audio file...")
-            temp_dir = tempfile.gettempdir()
-            audio_file = os.path.join(temp_dir, "drone_tts_method3.wav")
+            # A fresh file per utterance - a shared name could be overwritten while
+            # still playing, or removed by the previous utterance's delayed cleanup
+            fd, audio_file = tempfile.mkstemp(suffix='.wav', prefix='drone_tts_')
+            os.close(fd)
             
-            # Method 3a: Try espeak-ng file generation
-            file_generated = False
-            espeak_cmd = getattr(self, 'tts_engine', 'espeak-ng')
-            
-            try:
-                result = subprocess.run([espeak_cmd, '-w', audio_file, text], 
-                                      capture_output=True, timeout=10)
-                if result.returncode == 0 and os.path.exists(audio_file):
-                    file_generated = True
-                    self.log(f"✅ Audio file generated via {espeak_cmd}")
-            except Exception as e:
-                pass  # Silently handle espeak unavailability
+            # Method 3a: Try espeak-ng file generation - in-process first, then the command line
+            file_generated = _espeak_synth_to_wav(text, audio_file)
+            if file_generated:
+                self.log("✅ Audio file generated via libespeak-ng")
+            elif ESPEAK_COMMAND:
+                espeak_cmd = ESPEAK_COMMAND
+                try:
+                    result = subprocess.run([espeak_cmd, '-w', audio_file, text], 
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+                    if result.returncode == 0 and os.path.getsize(audio_file) > 0:
+                        file_generated = True
+                        self.log(f"✅ Audio file generated via {espeak_cmd}")
+                except Exception as e:
+                    pass  # Silently handle espeak unavailability
             
             # Method 3b: Try pyttsx3 file generation as backup
             if not file_generated and TTS_AVAILABLE:
                 try:
-                    import pyttsx3
                     file_engine = pyttsx3.init()
                     file_engine.save_to_file(text, audio_file)
                     file_engine.runAndWait()
-                    if os.path.exists(audio_file):
+                    if os.path.getsize(audio_file) > 0:
                         file_generated = True
                         self.log("✅ Audio file generated via pyttsx3")
                 except Exception as e:
@@ -3850,27 +4887,8 @@ Examples:
             # Method 3c: Try simple WAV generation
             if not file_generated:
                 try:
-                    import wave
-                    import struct
-                    import math
-                    
                     self.log("🔊 Generating simple beep tone...")
-                    sample_rate = 44100
-                    duration = 2.0
-                    frequency = 800
-                    
-                    frames = int(duration * sample_rate)
-                    wave_data = []
-                    
-                    for i in range(frames):
-                        value = int(32767 * math.sin(2 * math.pi * frequency * i / sample_rate))
-                        wave_data.append(struct.pack('<h', value))
-                    
-                    with wave.open(audio_file, 'wb') as wav_file:
-                        wav_file.setnchannels(1)  # Mono
-                        wav_file.setsampwidth(2)  # 2 bytes per sample
-                        wav_file.setframerate(sample_rate)
-                        wav_file.writeframes(b''.join(wave_data))
+                    _write_beep_wav(audio_file)
                     
                     file_generated = True
                     self.log("✅ Generated simple beep tone WAV file")
@@ -3890,7 +4908,6 @@ Examples:
                         play_obj = wave_obj.play()
                         
                         # Test that playback actually started
-                        import time
                         time.sleep(0.1)  # Brief wait to detect immediate failures
                         if not play_obj.is_playing():
                             raise Exception("Playback failed to start")
@@ -3898,50 +4915,38 @@ Examples:
                         self.log("✅ SUCCESS: Audio playing via simpleaudio")
                         system_audio_success = True
                         
-                        # Clean up file after playback completes
-                        import threading
-                        def cleanup_after_play():
-                            try:
-                                play_obj.wait_done()
-                                os.remove(audio_file)
-                                self.log("✅ Audio playback completed and file cleaned up")
-                            except Exception as e:
-                                self.log(f"⚠️ Cleanup error: {e}")
-                        threading.Thread(target=cleanup_after_play, daemon=True).start()
+                        # simpleaudio plays from memory, so the file can go right away
+                        try:
+                            os.remove(audio_file)
+                        except OSError as e:
+                            self.log(f"⚠️ Cleanup error: {e}")
                         return
                     except Exception as e:
                         self.log(f"❌ Simpleaudio failed: {e} - trying system players...")
                 
-                # Method 2: Enhanced system audio players with more options
-                import platform
-                self.log("🔊 Trying system audio players...")
+                # Method 2a: On Windows, play through the Win32 PlaySound API - no
+                # PowerShell process; blocks like PlaySync so speech stays in order
+                if IS_WINDOWS:
+                    try:
+                        winsound.PlaySound(audio_file, winsound.SND_FILENAME)
+                        self.log("✅ SUCCESS: Audio played via winsound")
+                        try:
+                            os.remove(audio_file)
+                        except OSError:
+                            pass
+                        return
+                    except Exception as e:
+                        self.log(f"❌ winsound playback failed: {e} - trying system players...")
                 
-                if platform.system() == "Windows":
-                    # Windows audio players (expanded list)
-                    players = [
-                        ('powershell', 'PowerShell Media Player'),
-                        ('wmplayer', 'Windows Media Player'), 
-                        ('ffplay', 'FFPlay'),
-                        ('vlc', 'VLC Media Player'),
-                        ('mplay32', 'Windows Media Player Classic')
-                    ]
-                else:
-                    # Linux/Unix audio players (expanded list)
-                    players = [
-                        ('aplay', 'ALSA Audio Player'),
-                        ('paplay', 'PulseAudio Player'),
-                        ('play', 'SoX Audio Player'), 
-                        ('ffplay', 'FFPlay'),
-                        ('mpg123', 'MPG123 Player'),
-                        ('cvlc', 'VLC Command Line')
-                    ]
+                # Method 2b: Enhanced system audio players with more options
+                self.log("🔊 Trying system audio players...")
                 
-                for player, description in players:
+                # Failed attempts are collected and logged as one line afterwards
+                attempts = []
+                for player, description in AVAILABLE_AUDIO_PLAYERS:
                     try:
-                        self.log(f"🔊 Trying {description} ({player})...")
-                        
                         # Handle different Windows players
-                        if player == 'powershell' and platform.system() == "Windows":
+                        if player == 'powershell' and IS_WINDOWS:
                             # Enhanced PowerShell command with better error handling
                             ps_cmd = f'''
                             try {{
@@ -3953,49 +4958,44 @@ Examples:
                                 exit 1
                             }}'''
                             play_result = subprocess.run(['powershell', '-Command', ps_cmd], 
-                                                       capture_output=True, timeout=60, 
-                                                       creationflags=subprocess.CREATE_NO_WINDOW,
+                                                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                                       timeout=60, 
+                                                       creationflags=SUBPROCESS_CREATION_FLAGS,
                                                        text=True)
                         else:
                             # Standard command for other players
-                            creation_flags = subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
                             play_result = subprocess.run([player, audio_file], 
-                                                       capture_output=True, timeout=10, 
-                                                       creationflags=creation_flags)
+                                                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                                       timeout=10, 
+                                                       creationflags=SUBPROCESS_CREATION_FLAGS)
                         
                         if play_result.returncode == 0:
                             self.log(f"✅ SUCCESS: Audio playing via {description}")
                             system_audio_success = True
                             
                             # Clean up file after a short delay
-                            import threading
-                            def cleanup_later():
-                                import time
-                                time.sleep(5)  # Give audio time to play
-                                try:
-                                    os.remove(audio_file)
-                                    self.log(f"✅ Audio file cleaned up after {description} playback")
-                                except:
-                                    pass
-                            threading.Thread(target=cleanup_later, daemon=True).start()
+                            _remove_file_later(audio_file, 5)  # Give audio time to play
                             return
                         else:
-                            stderr_msg = play_result.stderr.decode() if play_result.stderr else "No error output"
-                            self.log(f"❌ {description} failed (code {play_result.returncode}): {stderr_msg[:100]}")
+                            stderr_msg = play_result.stderr or b""
+                            if isinstance(stderr_msg, bytes):
+                                stderr_msg = stderr_msg.decode(errors='replace')
+                            attempts.append(f"{description}=code {play_result.returncode}"
+                                            + (f" ({stderr_msg.strip()[:100]})" if stderr_msg.strip() else ""))
                             
                     except subprocess.TimeoutExpired:
-                        self.log(f"⏱️ {description} timed out")
-                        continue
+                        attempts.append(f"{description}=timed out")
                     except Exception as e:
-                        self.log(f"❌ {description} error: {e}")
-                        continue
+                        attempts.append(f"{description}=error {e}")
+                
+                if attempts:
+                    self.log("❌ Audio player attempts: " + " | ".join(attempts))
                 
                 # Method 3: System-specific fallbacks before browser
                 self.log("🔊 Trying system-specific fallbacks...")
                 try:
-                    if platform.system() == "Windows":
+                    if IS_WINDOWS:
                         # Try Windows system sounds as fallback
-                        import winsound
                         self.log("🔊 Using Windows system beep as audio notification...")
                         winsound.Beep(800, 1000)  # 800Hz for 1 second
                         self.log("✅ SUCCESS: Windows system beep played")
@@ -4003,7 +5003,7 @@ Examples:
                     else:
                         # Try Linux system beep
                         beep_result = subprocess.run(['beep', '-f', '800', '-l', '1000'], 
-                                                   capture_output=True, timeout=3)
+                                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=3)
                         if beep_result.returncode == 0:
                             self.log("✅ SUCCESS: Linux system beep played")
                             system_audio_success = True
@@ -4015,9 +5015,6 @@ Examples:
                     self.log("⚠️ ALL SYSTEM AUDIO METHODS FAILED - using browser fallback...")
                     # Method 4: Browser playback (LAST RESORT ONLY)
                 try:
-                    import webbrowser
-                    import os
-                    
                     # Convert to file:// URL for browser
                     file_url = f"file://{os.path.abspath(audio_file)}"
                     self.log(f"🌐 Fallback: Opening audio in browser: {file_url}")
@@ -4025,15 +5022,7 @@ Examples:
                     self.log("✅ Audio opened in browser as fallback")
                     
                     # Keep file for a moment, then clean up
-                    import threading
-                    def cleanup_later():
-                        import time
-                        time.sleep(10)  # Give browser time to load the file
-                        try:
-                            os.remove(audio_file)
-                        except:
-                            pass
-                    threading.Thread(target=cleanup_later, daemon=True).start()
+                    _remove_file_later(audio_file, 10)  # Give browser time to load the file
                     return
                     
                 except Exception as e:
@@ -4043,6 +5032,7 @@ Examples:
                 self.log("💡 Audio will auto-open in browser tab - check for new browser tabs!")
             else:
                 self.log("❌ Could not generate any audio file")
+                _remove_file_later(audio_file, 0)
                 
         except Exception as e:
             self.log(f"❌ Method 3 audio error: {e}")
@@ -4068,9 +5058,13 @@ Examples:
             else:
                 self.tts_btn.config(text="🔇 TTS: Off", bg='#757575')
     
-    def test_audio_playback(self):
-        """Test audio playback with multiple methods as fallback."""
-        def audio_test_thread():
+    def test_audio_playback(self, full_diagnostics=False):
+        """Test audio playback with multiple methods as fallback.
+        
+        Stops at the first working method unless full_diagnostics is set, in which
+        case every method is tried ("audio diagnostics" command).
+        """
+        def run_audio_tests():
             test_message = "Drone audio system test. If you hear this, audio is working correctly."
             self.log("🔊 Testing audio playback...")
             
@@ -4086,20 +5080,23 @@ Examples:
                 except Exception as e:
                     self.log(f"❌ Direct TTS failed: {e}")
             
+            if method1_success and not full_diagnostics:
+                self.log("💡 No sound? Run 'audio diagnostics' to try every audio method")
+                return
+            
             # Continue to test other methods even if Method 1 "succeeded"
             self.log("🔄 Continuing to test additional audio methods...")
             
             # Method 2: Try system audio commands
             try:
                 self.log("🔊 Testing Method 2: System audio commands...")
-                import subprocess
-                import tempfile
-                import os
                 
                 # Try espeak directly
-                result = subprocess.run(['espeak', test_message], 
-                                      capture_output=True, timeout=10)
-                if result.returncode == 0:
+                result = None
+                if ESPEAK_COMMAND:
+                    result = subprocess.run([ESPEAK_COMMAND, test_message], 
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+                if result is not None and result.returncode == 0:
                     self.log("✅ Espeak audio test completed")
                     if method1_success:
                         self.log("🎯 Both TTS and Espeak completed - audio should be working!")
@@ -4112,9 +5109,6 @@ Examples:
             # Method 3: Generate audio file as fallback
             try:
                 self.log("🔊 Testing Method 3: Audio file generation...")
-                import tempfile
-                import os
-                import sys
                 
                 temp_dir = tempfile.gettempdir()
                 audio_file = os.path.join(temp_dir, "drone_audio_test.wav")
@@ -4135,10 +5129,13 @@ Examples:
                         self.log(f"❌ pyttsx3 file generation failed: {e}")
                 
                 # Option 3b: Use espeak to file
-                if not file_generated:
+                if not file_generated and _espeak_synth_to_wav(test_message, audio_file):
+                    file_generated = True
+                    self.log("✅ Audio file generated via libespeak-ng")
+                if not file_generated and ESPEAK_COMMAND:
                     try:
-                        result = subprocess.run(['espeak', '-w', audio_file, test_message], 
-                                              capture_output=True, timeout=10)
+                        result = subprocess.run([ESPEAK_COMMAND, '-w', audio_file, test_message], 
+                                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
                         if result.returncode == 0 and os.path.exists(audio_file):
                             file_generated = True
                             self.log("✅ Audio file generated via espeak")
@@ -4148,27 +5145,7 @@ Examples:
                 # Option 3c: Create a simple beep WAV file (cross-platform)
                 if not file_generated:
                     try:
-                        import wave
-                        import struct
-                        import math
-                        
-                        # Generate a simple beep tone
-                        sample_rate = 44100
-                        duration = 2.0
-                        frequency = 800
-                        
-                        frames = int(duration * sample_rate)
-                        wave_data = []
-                        
-                        for i in range(frames):
-                            value = int(32767 * math.sin(2 * math.pi * frequency * i / sample_rate))
-                            wave_data.append(struct.pack('<h', value))
-                        
-                        with wave.open(audio_file, 'wb') as wav_file:
-                            wav_file.setnchannels(1)  # Mono
-                            wav_file.setsampwidth(2)  # 2 bytes per sample
-                            wav_file.setframerate(sample_rate)
-                            wav_file.writeframes(b''.join(wave_data))
+                        _write_beep_wav(audio_file)
                         
                         file_generated = True
                         self.log("✅ Generated simple beep tone WAV file")
@@ -4182,16 +5159,10 @@ Examples:
                     # Try to play the file with platform-specific players
                     players_tried = []
                     
-                    if sys.platform.startswith('linux'):
-                        players = ['aplay', 'paplay', 'play', 'ffplay']
-                    elif sys.platform.startswith('win'):
-                        players = ['powershell', 'ffplay']
-                    elif sys.platform.startswith('darwin'):
-                        players = ['afplay', 'ffplay']
-                    else:
-                        players = ['ffplay', 'play']
-                    
-                    for player in players:
+                    for player in TEST_AUDIO_PLAYERS:
+                        if not shutil.which(player):
+                            players_tried.append(f"{player} (not installed)")
+                            continue
                         try:
                             if player == 'powershell':
                                 # Windows PowerShell audio
@@ -4199,7 +5170,7 @@ Examples:
                             else:
                                 cmd = [player, audio_file]
                             
-                            result = subprocess.run(cmd, capture_output=True, timeout=10)
+                            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
                             if result.returncode == 0:
                                 self.log(f"✅ Audio playback via {player} completed")
                                 return
@@ -4221,8 +5192,7 @@ Examples:
             # Method 4: Last resort - system beep
             try:
                 self.log("🔊 Testing Method 4: System beep...")
-                import subprocess
-                subprocess.run(['beep'], timeout=5)
+                subprocess.run(['beep'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 self.log("✅ System beep completed")
             except:
                 self.log("❌ All audio methods failed - check your system audio configuration")
@@ -4233,13 +5203,15 @@ Examples:
             self.test_audio_btn.config(text="🔊 Testing...", state='disabled')
         
         def restore_button():
-            # Restore button after test completes
-            threading.Timer(15.0, lambda: (
+            if hasattr(self, 'test_audio_btn'):
                 self.test_audio_btn.config(text="🔊 Test Audio", state='normal')
-                if hasattr(self, 'test_audio_btn') else None
-            )).start()
         
-        restore_button()
+        def audio_test_thread():
+            try:
+                run_audio_tests()
+            finally:
+                # Restore button as soon as the test completes, on the Tk thread
+                self.root.after(0, restore_button)
         
         # Run in separate thread to avoid blocking UI
         threading.Thread(target=audio_test_thread, daemon=True).start()
@@ -4259,7 +5231,7 @@ Examples:
         """Start continuous vision analysis."""
         try:
             self.continuous_vision_enabled = True
-            self.continuous_vision_running = True
+            self._vision_stop_event.clear()
             self.continuous_vision_thread = threading.Thread(target=self.continuous_vision_loop, daemon=True)
             self.continuous_vision_thread.start()
             
@@ -4270,7 +5242,7 @@ Examples:
             )
             
             self.log("🔄 Continuous vision analysis started")
-            self.update_vision_results(f"[{time.strftime('%H:%M:%S')}] Continuous vision analysis started (every {self.vision_analysis_interval}s)\n\n")
+            self.update_vision_results(f"[{self._clock_text()}] Continuous vision analysis started (every {self.vision_analysis_interval}s)\n\n")
             
         except Exception as e:
             self.log(f"❌ Failed to start continuous vision: {e}")
@@ -4280,7 +5252,7 @@ Examples:
         """Stop continuous vision analysis."""
         try:
             self.continuous_vision_enabled = False
-            self.continuous_vision_running = False
+            self._vision_stop_event.set()
             
             if self.continuous_vision_thread and self.continuous_vision_thread.is_alive():
                 self.continuous_vision_thread.join(timeout=3)
@@ -4292,14 +5264,16 @@ Examples:
             )
             
             self.log("🔄 Continuous vision analysis stopped")
-            self.update_vision_results(f"[{time.strftime('%H:%M:%S')}] Continuous vision analysis stopped\n\n")
+            self.update_vision_results(f"[{self._clock_text()}] Continuous vision analysis stopped\n\n")
             
         except Exception as e:
             self.log(f"❌ Failed to stop continuous vision: {e}")
     
     def continuous_vision_loop(self):
         """Continuous vision analysis loop running in separate thread."""
-        while self.continuous_vision_running and self.continuous_vision_enabled:
+        # Frame hash -> (description, monotonic time), least recently used first
+        described_frames = collections.OrderedDict()
+        while not self._vision_stop_event.is_set():
             try:
                 # Check if AI is still enabled and frame is available
                 if not self.ai_enabled or not self.azure_openai_client:
@@ -4310,28 +5284,46 @@ Examples:
                 frame_data = None
                 if hasattr(self.agent, 'current_frame') and self.agent.current_frame is not None:
                     frame_data = self.agent.current_frame
-                elif self.video_frame is not None:
-                    frame_data = self.video_frame
+                elif self._last_pil_frame is not None:
+                    frame_data = self._last_pil_frame
                 
                 if frame_data is not None:
-                    # Perform analysis
-                    description = self.analyze_image_with_ai(
-                        frame_data,
-                        "In 2-3 sentences, describe what you see from this drone's perspective. Focus on key objects, people, and notable changes."
-                    )
+                    # Skip the request when a near-identical frame was described recently
+                    frame_hash = _frame_dhash(frame_data)
+                    now = time.monotonic()
+                    cached_hash = next(
+                        (h for h, (_, seen_at) in described_frames.items()
+                         if now - seen_at < VISION_HASH_MAX_AGE
+                         and (h ^ frame_hash).bit_count() <= VISION_HASH_MAX_DISTANCE),
+                        None)
                     
-                    if description:
-                        self.update_vision_results(f"[{time.strftime('%H:%M:%S')}] Auto-Analysis: {description}\n\n")
+                    if cached_hash is not None:
+                        described_frames.move_to_end(cached_hash)
+                        description = described_frames[cached_hash][0]
+                        self.update_vision_results(
+                            f"[{self._clock_text()}] Auto-Analysis (scene unchanged): {description}\n\n")
+                    else:
+                        # Perform analysis
+                        description = self.analyze_image_with_ai(
+                            frame_data,
+                            "In 2-3 sentences, describe what you see from this drone's perspective. Focus on key objects, people, and notable changes.",
+                            speak_prefix="Auto analysis: "
+                        )
                         
-                        # Speak the continuous analysis result
-                        self.speak_text(f"Auto analysis: {description}")
+                        if description:
+                            described_frames[frame_hash] = (description, now)
+                            described_frames.move_to_end(frame_hash)
+                            if len(described_frames) > VISION_HASH_CACHE_SIZE:
+                                described_frames.popitem(last=False)
+                            self.update_vision_results(f"[{self._clock_text()}] Auto-Analysis: {description}\n\n")
                 
-                # Wait for next analysis interval
-                time.sleep(self.vision_analysis_interval)
+                # Wait for next analysis interval - returns early when stopped
+                if self._vision_stop_event.wait(self.vision_analysis_interval):
+                    break
                 
             except Exception as e:
                 self.log(f"❌ Continuous vision error: {e}")
-                time.sleep(1)  # Wait before retrying
+                self._vision_stop_event.wait(1)  # Wait before retrying
         
         # Clean up when loop ends
         self.continuous_vision_enabled = False
@@ -4462,49 +5454,46 @@ Examples:
             preview_area.insert('1.0', "🤖 Analyzing mission and generating safe commands...\n")
             preview_area.config(state='disabled')
             
+            def append_preview(text):
+                preview_area.config(state='normal')
+                preview_area.insert(tk.END, text)
+                preview_area.see(tk.END)
+                preview_area.config(state='disabled')
+            
             def generate_preview():
                 try:
-                    # Enhanced system prompt for mission planning
-                    system_prompt = """You are an expert drone mission planner. Convert natural language mission descriptions into safe, executable drone command sequences.
-
-Available commands:
-- takeoff: Make drone take off
-- land: Make drone land safely  
-- move_forward(distance): Move forward 20-500cm
-- move_back(distance): Move backward 20-500cm
-- move_left(distance): Move left 20-500cm
-- move_right(distance): Move right 20-500cm
-- move_up(distance): Move up 20-500cm
-- move_down(distance): Move down 20-500cm
-- rotate_clockwise(degrees): Rotate right 1-360°
-- rotate_counter_clockwise(degrees): Rotate left 1-360°
-- hover(seconds): Hover for 1-8 seconds
-- take_photo(): Take single photo
-- take_photo_burst(count): Take multiple photos
-
-SAFETY RULES:
-- Always start with takeoff if not already flying
-- Always end missions with land command
-- Keep distances reasonable (under 300cm for safety)
-- Include hover commands for stability between moves
-- Add safety margins and hover time before photos
-
-Respond with a JSON object: {"commands": [...], "safety_notes": "...", "estimated_time": "X minutes"}
-
-Example response:
-{"commands": [{"action": "takeoff", "parameters": {}}, {"action": "hover", "parameters": {"seconds": 3}}, {"action": "take_photo", "parameters": {}}, {"action": "land", "parameters": {}}], "safety_notes": "Mission includes proper takeoff/landing sequence with stability pauses", "estimated_time": "2 minutes"}"""
-
                     response = self.azure_openai_client.chat.completions.create(
                         model=self.azure_settings['deployment'],
                         messages=[
-                            {"role": "system", "content": system_prompt},
+                            {"role": "system", "content": AZURE_MISSION_SYSTEM_PROMPT},
                             {"role": "user", "content": f"Plan this mission: {mission_description}"}
                         ],
                         response_format={"type": "json_object"},
-                        max_tokens=1500
+                        max_tokens=1500,
+                        stream=True,
+                        timeout=MISSION_PLAN_TIMEOUT
                     )
                     
-                    ai_response = response.choices[0].message.content
+                    # Show the raw plan as it streams in, batched so Tk isn't
+                    # woken per token; it is replaced by the formatted preview below
+                    parts = []
+                    unsent = []
+                    last_flush = time.monotonic()
+                    for chunk in response:
+                        if not chunk.choices:
+                            continue  # Azure sends content-filter results in choice-less chunks
+                        text = chunk.choices[0].delta.content
+                        if not text:
+                            continue
+                        parts.append(text)
+                        unsent.append(text)
+                        now = time.monotonic()
+                        if now - last_flush >= MISSION_PREVIEW_FLUSH_INTERVAL:
+                            mission_window.after(0, append_preview, ''.join(unsent))
+                            unsent = []
+                            last_flush = now
+                    
+                    ai_response = ''.join(parts)
                     mission_plan = json.loads(ai_response)
                     
                     # Update preview area
@@ -4672,73 +5661,121 @@ Example response:
         
         self.log(f"✅ Mission validated - executing {len(commands)} commands via sequential processor")
         
-        # Convert AI commands to sequential processor format and execute
-        for i, cmd in enumerate(commands, 1):
+        # Queue every converted step in one pass - the agent's sequential processor
+        # runs them in order, so nothing here waits on the drone
+        messages = []
+        for i, action, cmd_str in self._translate_mission(commands):
             try:
-                action = cmd.get('action')
-                params = cmd.get('parameters', {})
-                
-                # Convert to command string for sequential processor
-                cmd_str = self._ai_command_to_string(action, params)
                 if cmd_str:
-                    result = self.agent.execute_command(cmd_str, 
-                        lambda r, step=i: self.log(f"🚀 Mission step {step}: {r}"))
-                    self.log(result)
+                    messages.append(self.agent.execute_command(cmd_str, 
+                        lambda r, step=i: self.log(f"🚀 Mission step {step}: {r}")))
                 else:
-                    self.log(f"❌ Cannot convert action '{action}' to safe command")
+                    messages.append(f"❌ Cannot convert action '{action}' to safe command")
                     
+            except Exception as e:
+                messages.append(f"❌ Mission step {i} error: {e}")
+        self.log_many(messages)
+    
+    def _translate_mission(self, commands):
+        """Convert AI mission commands up front into (step, action, command string or None)."""
+        steps = []
+        for i, cmd in enumerate(commands, 1):
+            action = cmd.get('action')
+            try:
+                cmd_str = self._ai_command_to_string(action, cmd.get('parameters', {}))
             except Exception as e:
                 self.log(f"❌ Mission step {i} error: {e}")
+                cmd_str = None
+            steps.append((i, action, cmd_str))
+        return steps
     
     def _execute_panorama_mission(self, commands):
         """Execute panorama commands and handle image collection."""
         self.panorama_images = []  # Store captured images
+        self._panorama_tile_futures = []  # Per-photo captions, started as photos arrive
         
         def panorama_callback(result, step_type):
             self.log(f"📷 Panorama {step_type}: {result}")
             # Collect images after photo commands
             if step_type == "photo" and hasattr(self.agent, 'current_frame') and self.agent.current_frame is not None:
-                self.panorama_images.append(self.agent.current_frame.copy())
+                frame = self.agent.current_frame.copy()
+                self.panorama_images.append(frame)
                 self.log(f"📷 Collected image {len(self.panorama_images)}/8 for stitching")
+                if self.ai_enabled and self.azure_openai_client:
+                    self._panorama_tile_futures.append(self._vision_pool.submit(
+                        self.analyze_image_with_ai, frame, PANORAMA_TILE_PROMPT, detail='low'))
                 
                 # Trigger stitching when we have all 8 images
                 if len(self.panorama_images) >= 8:
                     self.log("✅ All panorama images collected! Starting stitching...")
                     threading.Thread(target=self._finalize_panorama, daemon=True).start()
         
-        # Execute commands via sequential processor
-        for i, cmd in enumerate(commands, 1):
+        # Execute commands via sequential processor - each photo's callback runs once
+        # the capture has completed, so queueing doesn't need to wait between steps
+        messages = []
+        for i, action, cmd_str in self._translate_mission(commands):
             try:
-                action = cmd.get('action')
-                params = cmd.get('parameters', {})
-                
-                cmd_str = self._ai_command_to_string(action, params)
                 if cmd_str:
                     step_type = "rotation" if "rotate" in action else "hover" if action == "hover" else "photo"
-                    result = self.agent.execute_command(cmd_str, 
-                        lambda r, st=step_type: panorama_callback(r, st))
-                    self.log(result)
-                    
-                    # Wait for photo capture to complete
-                    if action == "take_photo":
-                        time.sleep(1)  # Allow time for frame capture
+                    messages.append(self.agent.execute_command(cmd_str, 
+                        lambda r, st=step_type: panorama_callback(r, st)))
                         
             except Exception as e:
-                self.log(f"❌ Panorama step {i} error: {e}")
+                messages.append(f"❌ Panorama step {i} error: {e}")
+        self.log_many(messages)
         
         # Stitching will be triggered when all 8 images are collected (see panorama_callback)
     
     def _finalize_panorama(self):
         """Finalize panorama by stitching collected images."""
+        tile_futures, self._panorama_tile_futures = self._panorama_tile_futures, []
         if len(self.panorama_images) >= 2:
             self.log(f"🔧 Starting panorama stitching with {len(self.panorama_images)} images...")
-            self.stitch_panorama(self.panorama_images)
+            # With per-photo captions the panorama image itself isn't sent for analysis
+            self.stitch_panorama(self.panorama_images, analyze=not tile_futures)
         else:
             self.log(f"❌ Insufficient images for stitching: {len(self.panorama_images)}/8")
         
+        if tile_futures:
+            self._summarize_panorama_tiles(tile_futures)
+        
         # Cleanup
         self.panorama_images = []
     
+    def _summarize_panorama_tiles(self, tile_futures):
+        """Combine the per-photo panorama captions into one scene description."""
+        try:
+            concurrent.futures.wait(tile_futures)
+            # Photos were taken evenly around the circle; label each caption with
+            # its heading so skipped (failed) ones don't shift the rest
+            heading_step = 360 / len(tile_futures)
+            captions = [
+                (i * heading_step, future.result()) for i, future in enumerate(tile_futures)
+                if not future.exception() and future.result()
+            ]
+            if not captions:
+                self.log("❌ Panorama AI analysis: no photo descriptions available")
+                return
+            
+            headed = '\n'.join(f"{heading:g}°: {caption}" for heading, caption in captions)
+            prompt = PANORAMA_SUMMARY_PROMPT.format(count=len(captions))
+            response = self.azure_openai_client.chat.completions.create(
+                model=self.azure_settings['deployment'],
+                messages=[
+                    {"role": "system", "content": AZURE_VISION_SYSTEM_PROMPT},
+                    {"role": "user", "content": f"{prompt}\n\n{headed}"}
+                ],
+                max_tokens=VISION_MAX_TOKENS,
+                timeout=VISION_REQUEST_TIMEOUT
+            )
+            result = response.choices[0].message.content
+            if result:
+                self.update_vision_results(f"[{self._clock_text()}] 360° Panorama Analysis:\n{result}\n\n")
+                self.speak_text(f"Panorama analysis complete: {result}")
+            
+        except Exception as e:
+            self.log(f"❌ Panorama AI analysis error: {e}")
+    
     def _validate_mission_safety(self, commands):
         """Validate mission commands for safety concerns."""
         safety_issues = []
@@ -4746,7 +5783,7 @@ Example response:
         flight_time = 0
         
         for cmd in commands:
-            action = cmd.get('action')
+            action = cmd.get('action') or ''
             params = cmd.get('parameters', {})
             
             # Check movement distances
@@ -4755,6 +5792,7 @@ Example response:
                 if distance > 300:
                     safety_issues.append(f"Large movement distance: {distance}cm (max recommended: 300cm)")
                 total_distance += distance
+                flight_time += distance / 50  # Rough estimate: 50cm/s
             
             # Check rotation angles
             elif 'rotate_' in action:
@@ -4768,10 +5806,6 @@ Example response:
                 if seconds > 8:
                     safety_issues.append(f"Long hover time: {seconds}s (max allowed: 8s)")
                 flight_time += seconds
-            
-            # Estimate flight time for movements
-            if 'move_' in action:
-                flight_time += params.get('distance', 0) / 50  # Rough estimate: 50cm/s
         
         # Overall mission checks
         if total_distance > 1000:
@@ -4785,86 +5819,28 @@ Example response:
     def _ai_command_to_string(self, action, params):
         """Convert AI command format to sequential processor string format."""
         # Handle function call format: e.g., 'move_forward(300)' → action='move_forward', params={'distance': 300}
-        import re
-        
         if '(' in action and action.endswith(')'):
-            # Parse function call format
-            func_match = re.match(r'(\w+)\(([^)]*)\)', action)
+            func_match = AI_FUNCTION_CALL_PATTERN.match(action)
             if func_match:
-                func_name = func_match.group(1)
+                action = func_match.group(1)
                 param_str = func_match.group(2).strip()
-                
-                # Parse parameters based on function type
-                if func_name in ['move_forward', 'move_back', 'move_left', 'move_right', 'move_up', 'move_down']:
-                    if param_str.isdigit():
-                        distance = int(param_str)
-                        direction = func_name.replace('move_', '')
-                        return f"{direction} {distance}"
-                elif func_name in ['rotate_clockwise', 'rotate_counter_clockwise']:
-                    if param_str.isdigit():
-                        degrees = int(param_str)
-                        rotation = 'cw' if 'clockwise' in func_name else 'ccw'
-                        return f"{rotation} {degrees}"
-                elif func_name == 'hover':
-                    if param_str.isdigit():
-                        seconds = int(param_str)
-                        return f"hover {seconds}"
-                elif func_name == 'take_photo':
-                    return 'photo'
-                
-                # Fallback - use original action name
-                action = func_name
-        
-        # Standard format handling  
-        if action == 'takeoff':
-            return 'takeoff'
-        elif action == 'land':
-            return 'land'
-        elif action in ['move_forward', 'move_back', 'move_left', 'move_right', 'move_up', 'move_down']:
-            direction = action.replace('move_', '')
-            distance = params.get('distance', 50)
-            return f"{direction} {distance}"
-        elif action == 'rotate_clockwise':
-            degrees = params.get('degrees', 90)
-            return f"cw {degrees}"
-        elif action == 'rotate_counter_clockwise':
-            degrees = params.get('degrees', 90)
-            return f"ccw {degrees}"
-        elif action == 'hover':
-            seconds = params.get('seconds', 3)
-            return f"hover {seconds}"
-        elif action == 'take_photo':
-            return 'photo'
-        elif action == 'take_photo_burst':
-            count = params.get('count', 3)
-            return f"burst {count}"
-        elif action == 'analyze_view':
-            # Special handling for vision analysis
-            prompt = params.get('prompt', 'Describe what you see')
-            use_photo = params.get('use_photo', False)
-            import json
-            params_json = json.dumps({"prompt": prompt, "use_photo": use_photo})
-            return f"analyze_view {params_json}"
-        else:
-            return None
+                param_name = AI_FUNCTION_CALL_PARAMS.get(action)
+                if param_name and param_str.isdigit():
+                    params = {param_name: int(param_str)}
+        
+        formatter = AI_ACTION_FORMATTERS.get(action)
+        return formatter(params) if formatter else None
     
-    def stitch_panorama(self, images):
-        """Stitch multiple images into a panorama using OpenCV with multiple fallback approaches."""
+    def stitch_panorama(self, images, analyze=True):
+        """Stitch multiple images into a panorama using OpenCV with multiple fallback approaches.
+        
+        The stitched result is sent for AI analysis unless analyze is False.
+        """
         try:
             self.log("🔧 Processing panorama with OpenCV Stitcher...")
             
-            # Convert and prepare images
-            processed_images = []
-            for img in images:
-                if img is not None:
-                    # Resize images for better stitching performance  
-                    height, width = img.shape[:2]
-                    if width > 800:  # Resize if too large
-                        scale = 800 / width
-                        new_width = int(width * scale)
-                        new_height = int(height * scale)
-                        img = cv2.resize(img, (new_width, new_height))
-                    processed_images.append(img)
+            # The stitcher downscales internally (see PANORAMA_*_RESOL)
+            processed_images = [img for img in images if img is not None]
             
             if len(processed_images) < 2:
                 self.log("❌ Need at least 2 images for stitching")
@@ -4873,25 +5849,19 @@ Example response:
             self.log(f"🔄 Attempting to stitch {len(processed_images)} images...")
             
             # Try multiple stitching approaches with fallback
-            approaches = [
-                {"mode": cv2.Stitcher_PANORAMA, "conf": 1.0, "name": "Standard Panorama"},
-                {"mode": cv2.Stitcher_PANORAMA, "conf": 0.3, "name": "Relaxed Panorama"},
-                {"mode": cv2.Stitcher_SCANS, "conf": 0.3, "name": "Scan Mode"},
-                {"mode": cv2.Stitcher_PANORAMA, "conf": 0.1, "name": "Lenient Panorama"}
-            ]
-            
-            for i, approach in enumerate(approaches, 1):
+            for i, (name, mode, conf, pano_conf) in enumerate(PANORAMA_STITCH_ATTEMPTS, 1):
                 try:
-                    self.log(f"🔧 Attempt {i}: {approach['name']} (confidence: {approach['conf']})")
+                    self.log(f"🔧 Attempt {i}: {name} (confidence: {conf})")
                     
-                    stitcher = cv2.Stitcher.create(approach["mode"])
-                    stitcher.setRegistrationResol(0.6)  # Lower resolution for faster processing
+                    stitcher = cv2.Stitcher.create(getattr(cv2, f"Stitcher_{mode}"))
+                    stitcher.setRegistrationResol(PANORAMA_REGISTRATION_RESOL)  # Lower resolution for faster processing
+                    stitcher.setCompositingResol(PANORAMA_COMPOSITING_RESOL)
                     
                     # Set confidence thresholds
                     if hasattr(stitcher, 'setConfidenceThresh'):
-                        stitcher.setConfidenceThresh(approach["conf"])
+                        stitcher.setConfidenceThresh(conf)
                     if hasattr(stitcher, 'setPanoConfidenceThresh'):
-                        stitcher.setPanoConfidenceThresh(approach["conf"] * 0.3)
+                        stitcher.setPanoConfidenceThresh(pano_conf)
                     
                     status, panorama = stitcher.stitch(processed_images)
                     
@@ -4901,13 +5871,13 @@ Example response:
                         filename = f"panorama_{timestamp}.jpg"
                         cv2.imwrite(filename, panorama)
                         
-                        self.log(f"✅ Panorama created successfully with {approach['name']}! Saved as {filename}")
+                        self.log(f"✅ Panorama created successfully with {name}! Saved as {filename}")
                         
                         # Optional: Show panorama in a new window
                         self.show_panorama_result(panorama, filename)
                         
                         # Optional: AI analysis of panorama
-                        if self.ai_enabled:
+                        if self.ai_enabled and analyze:
                             self.log("🤖 Analyzing panorama with AI...")
                             self.analyze_panorama_with_ai(panorama)
                             
@@ -4920,10 +5890,10 @@ Example response:
                             cv2.Stitcher_ERR_CAMERA_PARAMS_ADJUST_FAIL: "Camera parameter adjustment failed"
                         }
                         error_msg = error_messages.get(status, f"Unknown error (code: {status})")
-                        self.log(f"❌ {approach['name']} failed: {error_msg}")
+                        self.log(f"❌ {name} failed: {error_msg}")
                         
                 except Exception as e:
-                    self.log(f"❌ {approach['name']} error: {e}")
+                    self.log(f"❌ {name} error: {e}")
             
             # If all approaches failed
             self.log("❌ All stitching methods failed. This can happen with:")
@@ -4980,16 +5950,12 @@ Example response:
     def analyze_panorama_with_ai(self, panorama_img):
         """Analyze the panorama using AI vision."""
         try:
-            # Convert panorama to format suitable for AI analysis
-            panorama_rgb = cv2.cvtColor(panorama_img, cv2.COLOR_BGR2RGB)
-            
-            # Use existing AI analysis method
+            # analyze_image_with_ai takes numpy frames in OpenCV's BGR order
             prompt = "Analyze this 360-degree panoramic view captured by a drone. Describe the overall scene, key landmarks, objects, and any interesting features you can identify in this wide-angle view."
             
-            result = self.analyze_image_with_ai(panorama_rgb, prompt)
+            result = self.analyze_image_with_ai(panorama_img, prompt, speak_prefix="Panorama analysis complete: ")
             if result:
-                self.update_vision_results(f"[{time.strftime('%H:%M:%S')}] 360° Panorama Analysis:\n{result}\n\n")
-                self.speak_text(f"Panorama analysis complete: {result}")
+                self.update_vision_results(f"[{self._clock_text()}] 360° Panorama Analysis:\n{result}\n\n")
             
         except Exception as e:
             self.log(f"❌ Panorama AI analysis error: {e}")
@@ -5003,10 +5969,18 @@ Example response:
         finally:
             # Cleanup
             self.video_running = False
-            if hasattr(self, 'voice_enabled') and self.voice_enabled:
+            if self.voice_enabled:
                 self.stop_voice()
             if self.is_connected.get():
                 self.disconnect()
+            self._cmd_pool.shutdown(wait=False)
+            self._vision_pool.shutdown(wait=False)
+            self._cmd_q.put(None)
+            _stop_cleanup_worker(timeout=1.0)
+            
+            # Let the logger thread flush whatever is still queued
+            self._log_q.put(None)
+            self._log_thread.join(timeout=2.0)
 
 
 def main():
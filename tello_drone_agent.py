@@ -13,6 +13,7 @@ import atexit
 import queue
 import uuid
 import os
+from collections import deque
 import numpy as np
 from typing import Optional, Dict, Any, Callable, List, Tuple
 import logging
@@ -34,6 +35,9 @@ except ImportError:
     Tello = None
     DJITELLOPY_AVAILABLE = False
 
+# Number of saved photo paths remembered for "most recent photo" lookups
+RECENT_PHOTO_LIMIT = 32
+
 
 class TelloDroneAgent:
     """
@@ -78,8 +82,11 @@ class TelloDroneAgent:
         self.current_frame = None
         self.video_thread = None
         self.stop_video = False
+        self.recording = False
+        self.recent_photos = deque(maxlen=RECENT_PHOTO_LIMIT)  # Newest saved photo last
         self.flight_log = []
         self.frame_lock = threading.Lock()  # Protect frame access
+        self.frame_event = threading.Event()  # Set whenever a new frame is captured
         
         # Command queue for sequential execution
         self.command_queue = queue.Queue()
@@ -882,14 +889,28 @@ class TelloDroneAgent:
                 
                 with self.frame_lock:
                     self.current_frame = frame
+                self.frame_event.set()
                     
                 time.sleep(frame_delay)  # Dynamic FPS control
             except Exception as e:
                 self.logger.error(f"Video capture error: {str(e)}")
                 break
     
-    def get_current_frame(self):
-        """Get the current video frame safely."""
+    def get_current_frame(self, timeout: Optional[float] = None):
+        """
+        Get the current video frame safely.
+        
+        Args:
+            timeout: If given, block until a frame newer than the last one
+                returned by a blocking call arrives, or return None once
+                timeout seconds have passed. If None, return the latest
+                frame immediately.
+        """
+        if timeout is not None:
+            if not self.frame_event.wait(timeout):
+                return None
+            self.frame_event.clear()
+        
         with self.frame_lock:
             return self.current_frame
     
@@ -974,6 +995,7 @@ class TelloDroneAgent:
                 raise Exception("No frame available for photo")
             
             cv2.imwrite(filename, frame_to_save)
+            self.recent_photos.append(filename)
             self.logger.info(f"Photo saved: {filename}")
             self._log_action("Photo taken", {"filename": filename})
             return filename
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the drone GUI helpers that don't need a drone or a window.
+Run with: python -m unittest test_drone_gui
+"""
+
+import asyncio
+import types
+import unittest
+
+try:
+    import drone_gui
+except ImportError:  # GUI dependencies (PIL, numpy, ...) not installed
+    drone_gui = None
+
+
+@unittest.skipIf(drone_gui is None, "drone_gui dependencies not installed")
+class LocalAICommandTests(unittest.TestCase):
+
+    def test_photo_and_find(self):
+        commands = drone_gui._match_local_ai_command("Take a photo and find the red car")
+        self.assertEqual([c["action"] for c in commands], ["take_photo", "analyze_view"])
+        self.assertIn("the red car", commands[1]["parameters"]["prompt"])
+
+    def test_find_target_does_not_swallow_later_steps(self):
+        for text in ("take a photo and find the red car then land",
+                     "take a photo and find the red car and land",
+                     "take a photo and find the red car, then land"):
+            self.assertIsNone(drone_gui._match_local_ai_command(text), text)
+
+
+@unittest.skipIf(drone_gui is None, "drone_gui dependencies not installed")
+class FlyPathTests(unittest.TestCase):
+
+    def setUp(self):
+        self.sent = []
+        agent = types.SimpleNamespace(execute_command=lambda cmd: self.sent.append(cmd) or f"queued {cmd}")
+        self.gui = types.SimpleNamespace(agent=agent, log=lambda message: None)
+
+    def fly(self, steps):
+        return asyncio.run(drone_gui.DroneControlGUI.fly_path(self.gui, steps))
+
+    def test_valid_path_is_queued_in_order(self):
+        self.fly([{"action": "takeoff"},
+                  {"action": "precise_move_forward", "value": 100},
+                  {"action": "cw", "value": 90},
+                  {"action": "land"}])
+        self.assertEqual(self.sent, ["takeoff", "forward 100", "cw 90", "land"])
+
+    def test_bad_steps_are_rejected_before_anything_is_sent(self):
+        for steps in ([{"action": "takeoff"}, {"action": "flip", "value": 1}],
+                      [{"action": "takeoff"}, {"action": "precise_move_left", "value": 500}],
+                      [{"action": "takeoff"}, {"action": "up", "value": "50"}],
+                      [{"action": "takeoff"}, "forward 50"]):
+            result = self.fly(steps)
+            self.assertTrue(result.startswith("❌ Path step 2"), result)
+        self.assertEqual(self.sent, [])
+
+
+if __name__ == "__main__":
+    unittest.main()